@@ -15,6 +15,8 @@ Updates in this version
   - .get_endpoint(name)
   - .endpoints_list
 - Kept env-prefix overrides for secrets.
+- Dataclasses are frozen/slotted; validation and env overrides are resolved
+  once in Config.load_from_file instead of in each __post_init__.
 
 Usage:
     cfg = Config.load_from_file("config.yaml")
@@ -38,21 +40,36 @@ from dataclasses import dataclass
 from datetime import datetime
 from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Any, OrderedDict, Tuple
+from typing import Dict, List, Optional, Any, OrderedDict, Tuple, ClassVar, BinaryIO, Union, TYPE_CHECKING
 from collections import OrderedDict as _OrderedDict
+import base64
+import json
 import os
+import threading
+import time
 
-import yaml
-import requests
+if TYPE_CHECKING:  # requests is imported lazily, on first dashboard login
+    import requests
 
 from fabric_ceph.utils.log_helper import LogHelper
 
 DEFAULT_CONFIG_PATH = os.getenv("APP_CONFIG_PATH", "config.yml")
 
+# Environment variables that override secrets while building the config.
+_ENV_OVERRIDE_SUFFIXES = (
+    "_DASHBOARD_PASSWORD",
+    "_RGW_ADMIN_ACCESS_KEY",
+    "_RGW_ADMIN_SECRET_KEY",
+    "_CORE_API_TOKEN",
+)
+
 # ---------- helpers ----------
 def _ensure_nonempty_list(xs: Optional[List[str]], name: str) -> List[str]:
     if not xs or not isinstance(xs, list):
         raise ValueError(f"'{name}' must be a non-empty list")
+    # Common case: every entry is already a trimmed, non-empty string
+    if all(type(x) is str and x and not (x[0].isspace() or x[-1].isspace()) for x in xs):
+        return xs
     xs2 = [s for s in (x.strip() for x in xs) if s]
     if not xs2:
         raise ValueError(f"'{name}' is empty after trimming")
@@ -87,23 +104,92 @@ def _normalize_endpoints(obj: Any, name: str) -> "OrderedDict[str, str]":
     raise ValueError(f"'{name}' must be a mapping (name->url) or list of urls")
 
 
+def _jwt_expiry(token: str, default_ttl: float = 600.0) -> float:
+    """
+    Return the token expiry on the time.monotonic() clock, read from the JWT
+    'exp' claim without verifying the signature (default: now + 10 min).
+    """
+    now = time.monotonic()
+    try:
+        payload = token.split(".")[1]
+        claims = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+        return now + (float(claims["exp"]) - time.time())
+    except Exception:
+        return now + default_ttl
+
+
+def _yaml_load(stream: BinaryIO) -> Any:
+    # yaml is only needed while loading; import it here to keep module import cheap.
+    import yaml
+    # Prefer the libyaml C binding (requires libyaml-dev at PyYAML build time);
+    # fall back to the pure-Python loader when it is not available.
+    try:
+        from yaml import CSafeLoader as loader
+    except ImportError:  # pragma: no cover - depends on how PyYAML was built
+        from yaml import SafeLoader as loader
+    return yaml.load(stream, Loader=loader)
+
+
+def _dashboard_session() -> "requests.Session":
+    # requests (urllib3, ssl, charset detection) is only imported on first login.
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    s = requests.Session()
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32)
+    s.mount("http://", adapter)
+    s.mount("https://", adapter)
+    return s
+
+
+def _env_overrides() -> Dict[str, Dict[str, str]]:
+    """
+    Scan os.environ once for secret overrides, indexed as
+    {prefix: {suffix: value}}, e.g. {"US_WEST": {"_DASHBOARD_PASSWORD": "..."}}.
+    """
+    index: Dict[str, Dict[str, str]] = {}
+    for k, v in os.environ.items():
+        if not k.endswith(_ENV_OVERRIDE_SUFFIXES):
+            continue
+        for suffix in _ENV_OVERRIDE_SUFFIXES:
+            if k.endswith(suffix):
+                index.setdefault(k[:-len(suffix)], {})[suffix] = v
+                break
+    return index
+
+
 def parse_hms_to_datetime(hms: str) -> datetime:
     """
     Parse 'HH:MM:SS' to datetime.
     """
+    if type(hms) is str:
+        parts = hms.split(":")
+        if len(parts) == 3 and all(len(p) <= 2 and p.isdigit() for p in parts):
+            h, m, s = map(int, parts)
+            if h < 24 and m < 60 and s < 60:
+                return datetime(1900, 1, 1, h, m, s)
+    # Slow path keeps strptime's validation and error messages
     return datetime.strptime(hms, "%H:%M:%S")
 
 
+_TRUTHY = frozenset({"1", "true", "yes", "y", "on"})
+
+_BOOL_BY_TYPE = {
+    bool: lambda x: x,
+    str: lambda x: x.strip().lower() in _TRUTHY,
+}
+
+
 def _bool(x: Any) -> bool:
-    if isinstance(x, bool):
-        return x
-    if isinstance(x, str):
-        return x.strip().lower() in {"1", "true", "yes", "y", "on"}
-    return bool(x)
+    # One dict lookup on the exact type; only unknown types pay for isinstance
+    convert = _BOOL_BY_TYPE.get(type(x))
+    if convert is None:
+        convert = _BOOL_BY_TYPE[str] if isinstance(x, str) else bool
+    return convert(x)
 
 
 # ---------- dataclasses ----------
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DashboardConfig:
     endpoints: List[str]
     user: str
@@ -113,51 +199,82 @@ class DashboardConfig:
     ssh_user: Optional[str] = None
     ssh_key: Optional[str] = None
     ssh_port: Optional[int] = None
+    # optional CA bundle used to verify the dashboard's TLS certificate
+    ca_bundle: Optional[str] = None
+    # derived from endpoints[0] in __post_init__ when not given
+    primary_endpoint: str = ""
+    base_api_url: str = ""
+
+    # Shared across instances: keep-alive pool for /auth and cached JWTs
+    # keyed by (primary_endpoint, user) -> (monotonic expiry, token).
+    _session: ClassVar[Optional["requests.Session"]] = None
+    _token_cache: ClassVar[Dict[Tuple[str, str], Tuple[float, str]]] = {}
+    _token_lock: ClassVar[threading.Lock] = threading.Lock()
+    _TOKEN_EXPIRY_SKEW: ClassVar[float] = 30.0
+    # Upper bound on how long a token is reused, whatever its 'exp' says
+    _TOKEN_TTL: ClassVar[float] = 1800.0
 
     def __post_init__(self):
-        self.endpoints = _ensure_nonempty_list(self.endpoints, "cluster.<name>.dashboard.endpoints")
-        if not self.user:
-            raise ValueError("cluster.<name>.dashboard.user is required")
-        if self.env_prefix:
-            self.password = os.getenv(f"{self.env_prefix}_DASHBOARD_PASSWORD", self.password)
-
-    @property
-    def primary_endpoint(self) -> str:
-        return self.endpoints[0].rstrip("/")
-
-    @property
-    def base_api_url(self) -> str:
-        return f"{self.primary_endpoint}/api"
+        # computed once here instead of on every access; frozen, so bypass __setattr__
+        if not self.primary_endpoint and self.endpoints:
+            object.__setattr__(self, "primary_endpoint", self.endpoints[0].rstrip("/"))
+        if not self.base_api_url and self.primary_endpoint:
+            object.__setattr__(self, "base_api_url", f"{self.primary_endpoint}/api")
 
     def login_get_jwt(
         self,
-        verify_tls: Optional[bool] = None,
+        verify_tls: Optional[Union[bool, str]] = None,
         accept: str = "application/vnd.ceph.api.v1.0+json",
+        session: Optional["requests.Session"] = None,
     ) -> str:
         """
         POST /auth to obtain JWT token. Returns token string.
         If verify_tls is None, default to scheme: https=True, http=False.
+        A caller-supplied session (e.g. DashClient's per-cluster pool with its pinned
+        SSLContext) is used as is, with its own verify setting; verify_tls only applies
+        to the shared fallback session.
+        Tokens are reused until shortly before their 'exp' claim (at most
+        _TOKEN_TTL seconds); call invalidate_jwt() after a 401 to force a new login.
         """
-        if verify_tls is None:
-            verify_tls = self.primary_endpoint.startswith("https://")
+        key = (self.primary_endpoint, self.user)
+        cached = self._token_cache.get(key)
+        if cached and time.monotonic() < cached[0] - self._TOKEN_EXPIRY_SKEW:
+            return cached[1]
+
+        kwargs = {}
+        if session is None:
+            if verify_tls is None:
+                verify_tls = self.primary_endpoint.startswith("https://")
+            kwargs["verify"] = verify_tls
+            session = DashboardConfig._session
+            if session is None:
+                session = DashboardConfig._session = _dashboard_session()
 
         url = f"{self.base_api_url}/auth"
-        resp = requests.post(
+        resp = session.post(
             url,
             headers={"Accept": accept, "Content-Type": "application/json"},
             json={"username": self.user, "password": self.password},
-            verify=verify_tls,
             timeout=60,
+            **kwargs,
         )
         resp.raise_for_status()
         js = resp.json()
         token = js.get("token")
         if not token:
             raise RuntimeError(f"Login succeeded but no token in response: {js}")
+        expiry = min(_jwt_expiry(token), time.monotonic() + self._TOKEN_TTL)
+        with self._token_lock:
+            self._token_cache[key] = (expiry, token)
         return token
 
+    def invalidate_jwt(self) -> None:
+        """Drop the cached token so the next login_get_jwt() re-authenticates."""
+        with self._token_lock:
+            self._token_cache.pop((self.primary_endpoint, self.user), None)
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RGWAdminConfig:
     # normalized to an OrderedDict[str, str]
     endpoints_map: "OrderedDict[str, str]"
@@ -168,25 +285,18 @@ class RGWAdminConfig:
     ssh_user: Optional[str] = None
     ssh_key: Optional[str] = None
     ssh_port: Optional[int] = None
+    # first URL in the ordered map (by YAML order), derived in __post_init__ when not given
+    primary_endpoint: str = ""
 
     def __post_init__(self):
-        if self.env_prefix:
-            self.admin_access_key = os.getenv(f"{self.env_prefix}_RGW_ADMIN_ACCESS_KEY", self.admin_access_key)
-            self.admin_secret_key = os.getenv(f"{self.env_prefix}_RGW_ADMIN_SECRET_KEY", self.admin_secret_key)
-        if not self.endpoints_map:
-            raise ValueError("cluster.<name>.rgw_admin.endpoints must not be empty")
+        if not self.primary_endpoint and self.endpoints_map:
+            object.__setattr__(self, "primary_endpoint", next(iter(self.endpoints_map.values())).rstrip("/"))
 
     @property
     def endpoints(self) -> "OrderedDict[str, str]":
         """Back-compat alias."""
         return self.endpoints_map
 
-    @property
-    def primary_endpoint(self) -> str:
-        """First URL in the ordered map (by YAML order)."""
-        # next(iter(dict.values())) raises StopIteration if empty, but we validate non-empty in __post_init__
-        return next(iter(self.endpoints_map.values())).rstrip("/")
-
     @property
     def endpoints_list(self) -> List[str]:
         """List of endpoint URLs in order."""
@@ -198,21 +308,15 @@ class RGWAdminConfig:
         return v.rstrip("/") if v else None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ClusterEntry:
     ceph_cli: str
     default_fs: str
     dashboard: DashboardConfig
     rgw_admin: RGWAdminConfig
 
-    def __post_init__(self):
-        if not self.ceph_cli:
-            self.ceph_cli = "ceph"
-        if not self.default_fs:
-            raise ValueError("cluster.<name>.default_fs is required")
 
-
-@dataclass
+@dataclass(slots=True, frozen=True)
 class LoggingConfig:
     log_directory: Path
     log_file: str
@@ -236,7 +340,7 @@ class LoggingConfig:
         )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OAuthConfig:
     jwks_url: str
     key_refresh: datetime
@@ -247,28 +351,24 @@ class OAuthConfig:
         return cls(jwks_url=jwks_url, key_refresh=parse_hms_to_datetime(key_refresh), verify_exp=_bool(verify_exp))
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CoreAPIConfig:
     enable: bool = False
     host: Optional[str] = None
     token: Optional[str] = None
     env_prefix: Optional[str] = None
 
-    def __post_init__(self):
-        if self.env_prefix:
-            self.token = os.getenv(f"{self.env_prefix}_CORE_API_TOKEN", self.token)
-
     def is_enabled(self) -> bool:
         return self.enable and bool(self.host) and bool(self.token)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RuntimeConfig:
     service_project: Optional[str] = None
     port: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Config:
     cluster: Dict[str, ClusterEntry]
     runtime: RuntimeConfig
@@ -279,7 +379,14 @@ class Config:
     # ----------- loader -----------
     @classmethod
     def load_from_file(cls, path: str | Path) -> "Config":
-        data = yaml.safe_load(Path(path).read_text())
+        # Hand libyaml the file object so it reads through its own buffer
+        # instead of us materializing the whole file first.
+        with open(path, "rb") as f:
+            data = _yaml_load(f)
+        return cls._build(data, _env_overrides())
+
+    @classmethod
+    def _build(cls, data: Any, env_index: Dict[str, Dict[str, str]]) -> "Config":
         if not isinstance(data, dict):
             raise ValueError("Top-level YAML must be a mapping")
 
@@ -295,17 +402,24 @@ class Config:
 
             # Optional per-cluster env prefix to override secrets easily
             env_prefix = str(name).upper().replace("-", "_")
+            env = env_index.get(env_prefix, {}).get
 
             dash_raw = c.get("dashboard") or {}
             rgw_raw = c.get("rgw_admin") or {}
 
+            dash_user = dash_raw.get("user") or ""
+            if not dash_user:
+                raise ValueError(f"cluster.{name}.dashboard.user is required")
+            dash_endpoints = _ensure_nonempty_list(dash_raw.get("endpoints") or [],
+                                                   f"cluster.{name}.dashboard.endpoints")
             dashboard = DashboardConfig(
-                endpoints=dash_raw.get("endpoints") or [],
-                user=dash_raw.get("user") or "",
-                password=dash_raw.get("password") or "",
+                endpoints=dash_endpoints,
+                user=dash_user,
+                password=env("_DASHBOARD_PASSWORD", dash_raw.get("password") or ""),
                 ssh_key=dash_raw.get("ssh_key") or None,
                 ssh_user=dash_raw.get("ssh_user") or None,
                 ssh_port=dash_raw.get("ssh_port") or None,
+                ca_bundle=dash_raw.get("ca_bundle") or None,
                 env_prefix=env_prefix,
             )
 
@@ -316,17 +430,20 @@ class Config:
 
             rgw = RGWAdminConfig(
                 endpoints_map=rgw_endpoints_map,
-                admin_access_key=rgw_raw.get("admin_access_key") or "",
-                admin_secret_key=rgw_raw.get("admin_secret_key") or "",
+                admin_access_key=env("_RGW_ADMIN_ACCESS_KEY", rgw_raw.get("admin_access_key") or ""),
+                admin_secret_key=env("_RGW_ADMIN_SECRET_KEY", rgw_raw.get("admin_secret_key") or ""),
                 ssh_key=rgw_raw.get("ssh_key") or None,
                 ssh_user=rgw_raw.get("ssh_user") or None,
                 ssh_port=rgw_raw.get("ssh_port") or None,
                 env_prefix=env_prefix,
             )
 
+            default_fs = c.get("default_fs") or ""
+            if not default_fs:
+                raise ValueError(f"cluster.{name}.default_fs is required")
             entry = ClusterEntry(
                 ceph_cli=c.get("ceph_cli") or "ceph",
-                default_fs=c.get("default_fs") or "",
+                default_fs=default_fs,
                 dashboard=dashboard,
                 rgw_admin=rgw,
             )
@@ -366,7 +483,7 @@ class Config:
         core = CoreAPIConfig(
             enable=_bool(core_raw.get("enable", False)),
             host=core_raw.get("host"),
-            token=core_raw.get("token"),
+            token=env_index.get("CORE", {}).get("_CORE_API_TOKEN", core_raw.get("token")),
             env_prefix="CORE",  # allows CORE_CORE_API_TOKEN env override if desired
         )
 
@@ -374,10 +491,10 @@ class Config:
 
     # ----------- convenience -----------
     def get_cluster(self, name: str) -> ClusterEntry:
-        try:
-            return self.cluster[name]
-        except KeyError:
-            raise KeyError(f"Unknown cluster {name!r}. Available: {', '.join(self.cluster.keys())}")
+        entry = self.cluster.get(name)
+        if entry is None:
+            raise KeyError(f"Unknown cluster {name!r}. Available: {', '.join(self.cluster)}")
+        return entry
 
     def default_cluster(self) -> ClusterEntry:
         key = next(iter(self.cluster.keys()))
@@ -88,14 +88,8 @@ def create_or_resize_subvolume(cluster, vol_name, body):  # noqa: E501
             details = " ".join(f"{k}:{v}" for k, v in errors.items())
             return cors_500(details=details)
 
-        vol_info = Status200OkNoContentData()
-        vol_info.message = f"Subvolume {vol_name} created/resized."
-        vol_info.details = result
-        response = Status200OkNoContent()
-        response.data = [vol_info]
-        response.size = len(response.data)
-        response.status = 200
-        response.type = "no_content"
+        vol_info = Status200OkNoContentData(message=f"Subvolume {vol_name} created/resized.", details=result)
+        response = Status200OkNoContent(data=[vol_info], size=1, status=200, type="no_content")
         return cors_success_response(response_body=response)
 
     except Exception as e:
@@ -156,14 +150,8 @@ def delete_subvolume(cluster, vol_name, subvol_name, group_name=None, force=None
             details = " ".join(f"{k}:{v}" for k, v in errors.items())
             return cors_500(details=details)
 
-        vol_info = Status200OkNoContentData()
-        vol_info.message = f"Subvolume {vol_name} deleted."
-        vol_info.details = result
-        response = Status200OkNoContent()
-        response.data = [vol_info]
-        response.size = len(response.data)
-        response.status = 200
-        response.type = "no_content"
+        vol_info = Status200OkNoContentData(message=f"Subvolume {vol_name} deleted.", details=result)
+        response = Status200OkNoContent(data=[vol_info], size=1, status=200, type="no_content")
         return cors_success_response(response_body=response)
 
     except Exception as e:
@@ -211,14 +199,8 @@ def get_subvolume_info(cluster, vol_name, subvol_name, group_name=None):  # noqa
             # Treat as not found for this cluster
             raise CephException("Subvolume not found or info unavailable", http_error_code=NOT_FOUND)
 
-        vol_info = Status200OkNoContentData()
-        vol_info.message = f"Subvolume {vol_name} information retrieved."
-        vol_info.details = {cluster: js}
-        response = Status200OkNoContent()
-        response.data = [vol_info]
-        response.size = len(response.data)
-        response.status = 200
-        response.type = "no_content"
+        vol_info = Status200OkNoContentData(message=f"Subvolume {vol_name} information retrieved.", details={cluster: js})
+        response = Status200OkNoContent(data=[vol_info], size=1, status=200, type="no_content")
         return cors_success_response(response_body=response)
 
     except CephException as ce:
@@ -459,13 +441,8 @@ def delete_subvolume_group(cluster, vol_name, group_name=None, force=None):  # n
         # DashClient call
         dc.delete_subvolume_group(vol_name, group_name)
 
-        group_info = Status200OkNoContentData()
-        group_info.message = f"Subvolume group {group_name} deleted."
-        response = Status200OkNoContent()
-        response.data = [group_info]
-        response.size = len(response.data)
-        response.status = 200
-        response.type = "no_content"
+        group_info = Status200OkNoContentData(message=f"Subvolume group {group_name} deleted.")
+        response = Status200OkNoContent(data=[group_info], size=1, status=200, type="no_content")
         return cors_success_response(response_body=response)
 
     except Exception as e:
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
-from typing import Dict, Any, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Callable
 
+from fabric_ceph.common.config import ClusterEntry
 from fabric_ceph.common.globals import get_globals
-from fabric_ceph.openapi_server.models import ClusterInfoList, ClusterInfoItem
+from fabric_ceph.openapi_server.models import ClusterInfoList, ClusterInfoItem, ClusterInfoItemMonsInner
 from fabric_ceph.utils.dash_client import DashClient
 from fabric_ceph.utils.utils import cors_success_response, cors_error_response
 
@@ -27,45 +29,42 @@ def _norm_addr(addr: Optional[str]) -> Optional[str]:
         return None
     return addr if "/" in addr else f"{addr}/0"
 
+def _one_mon(m: Dict[str, Any]) -> Dict[str, Optional[str]]:
+    _get = m.get
+    addrvec = (_get("public_addrs") or {}).get("addrvec") or []
+    # Preferred: addrvec (has separate v2/v1 entries)
+    addrs = {a.get("type"): a.get("addr") for a in addrvec}
+    # Fallback: very old shape
+    v1 = addrs.get("v1") if addrvec else _get("public_addr")
+    return {"name": _get("name") or str(_get("rank")), "v2": _norm_addr(addrs.get("v2")), "v1": _norm_addr(v1)}
+
 def _parse_mon_map(mon_json: Dict[str, Any]) -> List[Dict[str, Optional[str]]]:
     """
     Returns a list of {name, v2, v1} from /api/monitor payload.
     Works for addrvec (msgr2+msgr1) and falls back if only v1 is present.
     """
-    mons_out: List[Dict[str, Optional[str]]] = []
     monmap = _extract_monmap(mon_json)
-    mons = (monmap or {}).get("mons", []) or []
-    for m in mons:
-        name = m.get("name") or str(m.get("rank"))
-        v1 = None
-        v2 = None
-        addrvec = ((m.get("public_addrs") or {}).get("addrvec") or [])
-        # Preferred: addrvec (has separate v2/v1 entries)
-        for a in addrvec:
-            t = a.get("type")
-            addr = a.get("addr")
-            if t == "v2":
-                v2 = _norm_addr(addr)
-            elif t == "v1":
-                v1 = _norm_addr(addr)
-        # Fallback: very old shape
-        if not addrvec and m.get("public_addr"):
-            v1 = _norm_addr(m["public_addr"])
-        mons_out.append({"name": name, "v2": v2, "v1": v1})
-    return mons_out
+    return [_one_mon(m) for m in (monmap or {}).get("mons", []) or []]
+
+# Indexed by (bool(v2) << 1) | bool(v1); a monitor with neither is skipped.
+_MON_HOST_FMT = (
+    None,
+    "[v1:{1}]".format,
+    "[v2:{0}]".format,
+    "[v2:{0},v1:{1}]".format,
+)
+
+def _mon_host_entry(m: Dict[str, Optional[str]]) -> Optional[str]:
+    v2 = m.get("v2")
+    v1 = m.get("v1")
+    fmt = _MON_HOST_FMT[(bool(v2) << 1) | bool(v1)]
+    return fmt(v2, v1) if fmt else None
 
 def _format_mon_host(mons: List[Dict[str, Optional[str]]]) -> str:
-    parts = []
-    for m in mons:
-        v2 = m.get("v2")
-        v1 = m.get("v1")
-        if v2 and v1:
-            parts.append(f"[v2:{v2},v1:{v1}]")
-        elif v2:
-            parts.append(f"[v2:{v2}]")
-        elif v1:
-            parts.append(f"[v1:{v1}]")
-    return " ".join(parts)
+    return " ".join(filter(None, map(_mon_host_entry, mons)))
+
+def _fetch(name: str, entry: ClusterEntry, call: Callable[[DashClient], Any]) -> Any:
+    return call(DashClient.for_cluster(name, entry))
 
 def list_cluster_info():
     """
@@ -78,50 +77,51 @@ def list_cluster_info():
         cfg = g.config
         items: List[Dict[str, Any]] = []
 
-        # Stable order across clusters
-        clients: Dict[str, DashClient] = {name: DashClient.for_cluster(name, entry)
-                                          for name, entry in cfg.cluster.items()}
-
-        for name, dc in clients.items():
-            try:
-                fsid = dc.get_cluster_fsid()
-                log.debug(f"Found fsid {fsid}")
-                mon_json = dc.get_monitor_map()
-                log.debug(f"Found mon json {mon_json}")
-                mons = _parse_mon_map(mon_json)
-                mon_host = _format_mon_host(mons)
-                ceph_conf = (
-                    f"[global]\n"
-                    f"\tfsid = {fsid}\n"
-                    f"\tmon_host = {mon_host}\n"
-                )
-                items.append({
-                    "cluster": name,
-                    "fsid": fsid,
-                    "mons": mons,
-                    "mon_host": mon_host,
-                    "ceph_conf_minimal": ceph_conf,
-                    "error": None,
-                })
-            except Exception as e:
-                log.exception("Failed to fetch cluster info for %s", name)
-                items.append({
-                    "cluster": name,
-                    "fsid": None,
-                    "mons": [],
-                    "mon_host": "",
-                    "ceph_conf_minimal": "",
-                    "error": str(e),
-                })
+        # Dashboard logins (on a client-cache miss) and the fsid/monmap lookups are
+        # independent per cluster; run them all concurrently and assemble results
+        # in config order. A cluster that fails to log in only marks its own item.
+        with ThreadPoolExecutor(max_workers=min(16, 2 * len(cfg.cluster))) as ex:
+            pending = [(name,
+                        ex.submit(_fetch, name, entry, DashClient.get_cluster_fsid),
+                        ex.submit(_fetch, name, entry, DashClient.get_monitor_map))
+                       for name, entry in cfg.cluster.items()]
+            for name, fsid_future, mon_future in pending:
+                try:
+                    fsid = fsid_future.result()
+                    log.debug(f"Found fsid {fsid}")
+                    mon_json = mon_future.result()
+                    log.debug(f"Found mon json {mon_json}")
+                    mons = _parse_mon_map(mon_json)
+                    mon_host = _format_mon_host(mons)
+                    ceph_conf = (
+                        f"[global]\n"
+                        f"\tfsid = {fsid}\n"
+                        f"\tmon_host = {mon_host}\n"
+                    )
+                    items.append({
+                        "cluster": name,
+                        "fsid": fsid,
+                        "mons": mons,
+                        "mon_host": mon_host,
+                        "ceph_conf_minimal": ceph_conf,
+                        "error": None,
+                    })
+                except Exception as e:
+                    log.exception("Failed to fetch cluster info for %s", name)
+                    items.append({
+                        "cluster": name,
+                        "fsid": None,
+                        "mons": [],
+                        "mon_host": "",
+                        "ceph_conf_minimal": "",
+                        "error": str(e),
+                    })
 
-        response = ClusterInfoList()
-        response.data = []
-        response.type = 'clusters'
-        for c in items:
-            cluster = ClusterInfoItem.from_dict(c)
-            response.data.append(cluster)
-        response.size = len(response.data)
-        response.status = 200
+        # items are built above from already-normalized values, so construct
+        # the models directly instead of round-tripping through from_dict.
+        data = [ClusterInfoItem(**{**c, "mons": [ClusterInfoItemMonsInner(**m) for m in c["mons"]]})
+                for c in items]
+        response = ClusterInfoList(data=data, size=len(data), status=200, type='clusters')
 
         return cors_success_response(response_body=response)
 
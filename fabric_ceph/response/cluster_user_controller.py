@@ -48,9 +48,6 @@ def apply_user_templated(cluster, body):  # noqa: E501
         if not is_operator:
             return cors_401(details=f"{fabric_token.uuid}/{fabric_token.email} is not authorized!")
 
-        if connexion.request.is_json:
-            body = connexion.request.get_json()
-
         user_entity = body["user_entity"]
         tmpl_caps   = body["template_capabilities"]
         renders     = body.get("renders")  # REQUIRED: list of {fs_name, subvol_name, [group_name]}
@@ -81,19 +78,19 @@ def apply_user_templated(cluster, body):  # noqa: E501
 
         # For top-level fields in ApplyUserResponse, use the FIRST render as representative
         first = renders[0]
-        response = ApplyUserResponse.from_dict({
-            "user_entity": user_entity,
-            "fs_name": first["fs_name"],
-            "subvol_name": first["subvol_name"],
-            "group_name": first.get("group_name"),
-            "source_cluster": summary.get("source_cluster"),
-            "created_on_source": summary.get("created_on_source"),
-            "updated_on_source": summary.get("updated_on_source"),
-            "imported_to": summary.get("imported_to", []),   # will be empty in per-cluster mode
-            "caps_applied": summary.get("caps_applied", {}), # { cluster: [ {entity,cap}, ... ] }
-            "paths": summary.get("paths", {}),               # { cluster: "<first path>" }
-            "errors": summary.get("errors", {}),
-        })
+        response = ApplyUserResponse(
+            user_entity=user_entity,
+            fs_name=first["fs_name"],
+            subvol_name=first["subvol_name"],
+            group_name=first.get("group_name"),
+            source_cluster=summary.get("source_cluster"),
+            created_on_source=summary.get("created_on_source"),
+            updated_on_source=summary.get("updated_on_source"),
+            imported_to=summary.get("imported_to", []),   # will be empty in per-cluster mode
+            caps_applied=summary.get("caps_applied", {}), # { cluster: [ {entity,cap}, ... ] }
+            paths=summary.get("paths", {}),               # { cluster: "<first path>" }
+            errors=summary.get("errors", {}),
+        )
         return cors_success_response(response_body=response)
 
     except Exception as e:
@@ -131,14 +128,8 @@ def delete_user(cluster, entity):  # noqa: E501
             details = " ".join(f"{k}:{v}" for k, v in errors.items())
             return cors_500(details=details)
 
-        user_info = Status200OkNoContentData()
-        user_info.message = f"User {entity} deleted."
-        user_info.details = result
-        response = Status200OkNoContent()
-        response.data = [user_info]
-        response.size = len(response.data)
-        response.status = 200
-        response.type = 'no_content'
+        user_info = Status200OkNoContentData(message=f"User {entity} deleted.", details=result)
+        response = Status200OkNoContent(data=[user_info], size=1, status=200, type="no_content")
         return cors_success_response(response_body=response)
 
     except Exception as e:
@@ -157,9 +148,8 @@ def export_users(cluster, body):  # noqa: E501
 
     :rtype: Union[ExportUsersResponse, Tuple[ExportUsersResponse, int], Tuple[ExportUsersResponse, int, Dict[str, str]]
     """
-    export_users_request = body
-    if connexion.request.is_json:
-        export_users_request = ExportUsersRequest.from_dict(connexion.request.get_json())  # noqa: E501
+    # connexion has already parsed the JSON body into a dict
+    export_users_request = ExportUsersRequest.from_dict(body) if isinstance(body, dict) else body  # noqa: E501
 
     globals = get_globals()
     log = globals.log
@@ -188,11 +178,7 @@ def export_users(cluster, body):  # noqa: E501
         clusters_map = {cluster: per_cluster.get("entities", {})}
         log.debug(f"Exported CephX users from {cluster}: {clusters_map}")
 
-        response = ExportUsersResponse()
-        response.clusters = clusters_map
-        response.size = len(response.clusters)
-        response.status = 200
-        response.type = "keyrings"
+        response = ExportUsersResponse(clusters=clusters_map, size=len(clusters_map), status=200, type="keyrings")
         return cors_success_response(response_body=response)
     except Exception as e:
         log.exception(f"Failed processing CephX export request: {e}")
@@ -222,7 +208,10 @@ def _raw_user_to_ceph_user(raw: Dict[str, Any]) -> CephUser:
 
     # capabilities: accept either a list (already normalized) or a dict mapping
     if isinstance(raw.get("capabilities"), list):
-        caps_list: List[Dict[str, str]] = raw["capabilities"]
+        # keep only the model's fields; dashboards may add their own per-cap keys
+        caps_list: List[Dict[str, str]] = [{"entity": c["entity"], "cap": c["cap"]}
+                                           for c in raw["capabilities"]
+                                           if isinstance(c, dict) and "entity" in c and "cap" in c]
     else:
         caps_map: Dict[str, str] = raw.get("caps") or {}
         caps_list = [{"entity": ent, "cap": cap} for ent, cap in caps_map.items()]
@@ -235,14 +224,8 @@ def _raw_user_to_ceph_user(raw: Dict[str, Any]) -> CephUser:
     for k in raw.keys() - {"entity", "user_entity", "id", "caps", "capabilities", "key", "keys"}:
         meta[k] = raw[k]
 
-    payload: Dict[str, Any] = {
-        "user_entity": user_entity,
-        "capabilities": caps_list,
-    }
-    if meta:
-        payload["metadata"] = meta
     # keys are optional; omit rather than sending a masked/meaningless value
-    return CephUser.from_dict(payload)
+    return CephUser(user_entity=user_entity, capabilities=caps_list, metadata=meta or None)
 
 def list_users(cluster):  # noqa: E501
     """List all CephX users
@@ -267,11 +250,7 @@ def list_users(cluster):  # noqa: E501
         raw_users = result.get("users", [])
         users = [_raw_user_to_ceph_user(u) for u in raw_users if not _is_system_user(u)]
 
-        resp = Users()
-        resp.data = users
-        resp.size = len(users)
-        resp.status = 200
-        resp.type = "users"
+        resp = Users(data=users, size=len(users), status=200, type="users")
         return cors_200(response_body=resp)
     except Exception as e:
         log.exception(f"Failed processing CephX list request: {e}")
@@ -392,10 +371,6 @@ def overwrite_user_caps(cluster, body):  # noqa: E501
             log.error(f"{fabric_token.uuid}/{fabric_token.email} is not authorized!")
             return cors_401(details=f"{fabric_token.uuid}/{fabric_token.email} is not authorized!")
 
-        # Parse/normalize body
-        if connexion.request.is_json:
-            body = connexion.request.get_json()
-
         if not isinstance(body, dict):
             log.error(f"Failed processing CephX overwrite caps request: {body}")
             return cors_400(details="Request body must be JSON object")
@@ -424,19 +399,16 @@ def overwrite_user_caps(cluster, body):  # noqa: E501
             return cors_500(details=f"Dashboard returned HTTP {status}:{detail} while updating caps")
 
         # Build response
-        info = Status200OkNoContentData()
-        info.message = f"User {user_entity} capabilities overwritten."
-        info.details = {
-            "cluster": cluster,
-            "user_entity": user_entity,
-            "capabilities": capabilities,
-            "http_status": status,
-        }
-        resp = Status200OkNoContent()
-        resp.data = [info]
-        resp.size = 1
-        resp.status = 200
-        resp.type = "no_content"
+        info = Status200OkNoContentData(
+            message=f"User {user_entity} capabilities overwritten.",
+            details={
+                "cluster": cluster,
+                "user_entity": user_entity,
+                "capabilities": capabilities,
+                "http_status": status,
+            },
+        )
+        resp = Status200OkNoContent(data=[info], size=1, status=200, type="no_content")
         return cors_success_response(response_body=resp)
 
     except Exception as e:
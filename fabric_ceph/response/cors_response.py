@@ -9,8 +9,27 @@ from fabric_ceph.openapi_server.models import Version, Status500InternalServerEr
     Status401UnauthorizedErrors, Status401Unauthorized, Status400BadRequestErrors, Status400BadRequest, \
     Status200OkNoContentData, Status200OkNoContent, Users
 
+try:
+    import orjson  # optional: much faster encoder, returns bytes
+except ImportError:
+    orjson = None
+
+# Indent for JSON responses; 0 means compact. With orjson installed any non-zero
+# value renders as a 2-space indent (the only one orjson supports).
 _INDENT = int(os.getenv('OC_API_JSON_RESPONSE_INDENT', '4'))
 
+if orjson is not None:
+    _ORJSON_OPTS = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if _INDENT != 0 else 0)
+
+
+def _dumps(obj) -> Union[str, bytes]:
+    """
+    Encode a response body, using orjson when it is installed
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=_ORJSON_OPTS)
+    return json.dumps(obj, indent=_INDENT, sort_keys=True) if _INDENT != 0 else json.dumps(obj, sort_keys=True)
+
 
 def delete_none(_dict):
     """
@@ -54,8 +73,7 @@ def cors_200(response_body: Union[Version, Users] = None) -> Response:
     """
     Return 200 - OK
     """
-    body = json.dumps(delete_none(response_body.to_dict()), indent=_INDENT, sort_keys=True) \
-        if _INDENT != 0 else json.dumps(delete_none(response_body.to_dict()), sort_keys=True)
+    body = _dumps(delete_none(response_body.to_dict()))
     return cors_response(
         req=request,
         status_code=200,
@@ -73,8 +91,7 @@ def cors_200_no_content(details: str|dict = None) -> Response:
     return cors_response(
         req=request,
         status_code=200,
-        body=json.dumps(delete_none(data_object.to_dict()), indent=_INDENT, sort_keys=True)
-        if _INDENT != 0 else json.dumps(delete_none(data_object.to_dict()), sort_keys=True),
+        body=_dumps(delete_none(data_object.to_dict())),
         x_error=details
     )
 
@@ -89,8 +106,7 @@ def cors_400(details: str = None) -> Response:
     return cors_response(
         req=request,
         status_code=400,
-        body=json.dumps(delete_none(error_object.to_dict()), indent=_INDENT, sort_keys=True)
-        if _INDENT != 0 else json.dumps(delete_none(error_object.to_dict()), sort_keys=True),
+        body=_dumps(delete_none(error_object.to_dict())),
         x_error=details
     )
 
@@ -105,8 +121,7 @@ def cors_401(details: str = None) -> Response:
     return cors_response(
         req=request,
         status_code=401,
-        body=json.dumps(delete_none(error_object.to_dict()), indent=_INDENT, sort_keys=True)
-        if _INDENT != 0 else json.dumps(delete_none(error_object.to_dict()), sort_keys=True),
+        body=_dumps(delete_none(error_object.to_dict())),
         x_error=details
     )
 
@@ -121,8 +136,7 @@ def cors_403(details: str = None) -> Response:
     return cors_response(
         req=request,
         status_code=403,
-        body=json.dumps(delete_none(error_object.to_dict()), indent=_INDENT, sort_keys=True)
-        if _INDENT != 0 else json.dumps(delete_none(error_object.to_dict()), sort_keys=True),
+        body=_dumps(delete_none(error_object.to_dict())),
         x_error=details
     )
 
@@ -137,8 +151,7 @@ def cors_404(details: str = None) -> Response:
     return cors_response(
         req=request,
         status_code=404,
-        body=json.dumps(delete_none(error_object.to_dict()), indent=_INDENT, sort_keys=True)
-        if _INDENT != 0 else json.dumps(delete_none(error_object.to_dict()), sort_keys=True),
+        body=_dumps(delete_none(error_object.to_dict())),
         x_error=details
     )
 
@@ -153,7 +166,6 @@ def cors_500(details: str = None) -> Response:
     return cors_response(
         req=request,
         status_code=500,
-        body=json.dumps(delete_none(error_object.to_dict()), indent=_INDENT, sort_keys=True)
-        if _INDENT != 0 else json.dumps(delete_none(error_object.to_dict()), sort_keys=True),
+        body=_dumps(delete_none(error_object.to_dict())),
         x_error=details
     )
@@ -1,5 +1,6 @@
 # fabric_ceph/response/serialization.py
 
+from collections import deque
 from dataclasses import is_dataclass, asdict
 from datetime import date, datetime
 from enum import Enum
@@ -14,13 +15,63 @@ try:
 except Exception:
     Model = tuple()  # harmless fallback
 
+_PRIMITIVES = (str, int, float, bool, type(None))
+
+
+def _normalize_leaves(raw):
+    """
+    Make an already-built to_dict() tree JSON-serializable in one iterative pass.
+    Containers are copied (dict keys stringified, sequences to lists); other leaves
+    (datetime, Enum, UUID, ...) go through deep_to_dict. Models were already
+    expanded by to_dict(), so this never re-walks a model subtree.
+    """
+    root = [raw]
+    memo = {}  # id(container) -> converted copy; also guards against cycles
+    work = deque([(root, 0, raw)])
+    while work:
+        parent, key, value = work.popleft()
+        t = type(value)
+        if t in _PRIMITIVES:
+            continue
+        if t is dict or t is list or t is tuple or t is set:
+            done = memo.get(id(value))
+            if done is not None:
+                parent[key] = done
+                continue
+            if t is dict:
+                out = {str(k): v for k, v in value.items()}
+                items = out.items()
+            else:
+                out = list(value)
+                items = enumerate(out)
+            memo[id(value)] = parent[key] = out
+            work.extend((out, k, v) for k, v in items)
+        else:
+            parent[key] = deep_to_dict(value)
+    return root[0]
+
+
 def deep_to_dict(value, *, _seen=None):
     """Recursively convert models and common Python objects to JSON-serializable primitives."""
+    # Exact-type fast paths for JSON-shaped data; subclasses fall through to isinstance below
+    t = type(value)
+    if t is str or t is int or t is float or t is bool or value is None:
+        return value
+
     if _seen is None:
         _seen = set()
 
+    if t is dict or t is list:
+        obj_id = id(value)
+        if obj_id in _seen:
+            return None
+        _seen.add(obj_id)
+        if t is dict:
+            return {str(k): deep_to_dict(v, _seen=_seen) for k, v in value.items()}
+        return [deep_to_dict(v, _seen=_seen) for v in value]
+
     # None / primitives
-    if value is None or isinstance(value, (str, int, float, bool)):
+    if isinstance(value, (str, int, float, bool)):
         return value
 
     # Datetime / date / Enum / Decimal-ish / UUID / Path
@@ -51,7 +102,7 @@ def deep_to_dict(value, *, _seen=None):
         except TypeError:
             # Some generators require to_dict(self) without args; just re-raise other issues
             raw = value.to_dict()
-        return deep_to_dict(raw, _seen=_seen)
+        return _normalize_leaves(raw)
 
     # Dataclasses
     if is_dataclass(value):
@@ -27,6 +27,10 @@ import datetime
 import hashlib
 import json
 import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
 
 from fabric_cm.credmgr.credmgr_proxy import CredmgrProxy, Status
 from fabric_cm.credmgr.swagger_client.rest import ApiException
@@ -40,6 +44,11 @@ class TokenValidator:
     """This class caches revoke list retrieved from a specified endpoint
     and uses it to validate provided tokens"""
 
+    # Upper bound on remembered tokens; least recently used entries are evicted first
+    VALIDATED_CACHE_SIZE = 4096
+    # Stop reusing a cached token this many seconds before its 'exp'
+    VALIDATED_EXPIRY_SKEW = 5
+
     def __init__(self, *, credmgr_host: str, refresh_period: datetime.timedelta,
                  jwt_validator: JWTValidator):
         """ Initialize a validator with an endpoint URL presenting Token revoke list,
@@ -56,6 +65,38 @@ class TokenValidator:
         self.credmgr_proxy = CredmgrProxy(credmgr_host=credmgr_host)
         self.jwt_validator = jwt_validator
         self.logger = logging.getLogger()
+        # token sha256 -> decoded claims of tokens whose signature already verified (LRU)
+        self.validated = OrderedDict()
+        self.validated_lock = threading.Lock()
+
+    def __get_validated(self, *, token_hash: str) -> Optional[dict]:
+        """
+        Return the cached claims for a previously verified token, if it has not expired
+        @param token_hash token hash
+        """
+        with self.validated_lock:
+            decoded = self.validated.get(token_hash)
+            if decoded is None:
+                return None
+            if time.time() >= decoded["exp"] - self.VALIDATED_EXPIRY_SKEW:
+                del self.validated[token_hash]
+                return None
+            self.validated.move_to_end(token_hash)
+            return decoded
+
+    def __put_validated(self, *, token_hash: str, decoded: dict):
+        """
+        Remember the claims of a verified token; tokens without a numeric 'exp' are not cached
+        @param token_hash token hash
+        @param decoded decoded token
+        """
+        if not isinstance(decoded, dict) or not isinstance(decoded.get("exp"), (int, float)):
+            return
+        with self.validated_lock:
+            self.validated[token_hash] = decoded
+            self.validated.move_to_end(token_hash)
+            while len(self.validated) > self.VALIDATED_CACHE_SIZE:
+                self.validated.popitem(last=False)
 
     def __fetch_token_revoke_list(self, *, project_id: str):
         """
@@ -85,6 +126,8 @@ class TokenValidator:
         """
         Validate a token using a JWT Validator
         Returns the decoded token
+        The signature check is skipped for a token that was already verified and has not
+        expired; the revoke list is still consulted on every call.
         :param token:
         :param verify_exp:
         :return decoded token in a dictionary
@@ -92,11 +135,15 @@ class TokenValidator:
         result = None
         token_hash = self.generate_sha256(token=token)
         if self.jwt_validator is not None:
-            code, token_or_exception = self.jwt_validator.validate_jwt(token=token, verify_exp=verify_exp)
-            if code is not ValidateCode.VALID:
-                raise TokenException(f"Unable to validate provided token: {code}/{token_or_exception}")
+            decoded = self.__get_validated(token_hash=token_hash)
+            if decoded is None:
+                code, token_or_exception = self.jwt_validator.validate_jwt(token=token, verify_exp=verify_exp)
+                if code is not ValidateCode.VALID:
+                    raise TokenException(f"Unable to validate provided token: {code}/{token_or_exception}")
+                decoded = token_or_exception
+                self.__put_validated(token_hash=token_hash, decoded=decoded)
 
-            result = FabricToken(decoded_token=token_or_exception, token_hash=token_hash)
+            result = FabricToken(decoded_token=decoded, token_hash=token_hash)
             project_id, tags, name = result.first_project
             self.__fetch_token_revoke_list(project_id=project_id)
             if token_hash in self.trl:
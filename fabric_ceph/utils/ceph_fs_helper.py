@@ -34,7 +34,7 @@ from fabric_ceph.utils.dash_client import DashClient
 
 # ---------- results ----------
 
-@dataclass
+@dataclass(slots=True)
 class SubvolSyncResult:
     fs_name: str
     group_name: Optional[str]
@@ -63,7 +63,7 @@ class SubvolSyncResult:
             "errors": self.errors,
         }
 
-@dataclass
+@dataclass(slots=True)
 class SubvolDeleteResult:
     fs_name: str
     group_name: Optional[str]
@@ -3,15 +3,18 @@ from __future__ import annotations
 
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
 from http.client import BAD_REQUEST
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, FrozenSet, List, Optional
 
 from fabric_ceph.common.config import Config
 from fabric_ceph.response.ceph_exception import CephException
 from fabric_ceph.utils.dash_client import DashClient
 from fabric_ceph.utils.keyring_parser import keyring_minimal
 import re
+import string
 from typing import Tuple
 
 # ---------- helpers (unchanged) ----------
@@ -19,6 +22,21 @@ from typing import Tuple
 # Stronger > weaker
 _PERM_ORDER = {"r": 0, "rw": 1, "rwps": 2}
 
+# Upper bound on concurrent dashboard calls issued for one request
+_MAX_WORKERS = 8
+
+# Keyring / caps patterns, compiled once
+_KEYRING_CAPS_RE = re.compile(r'caps\s+(mon|mds|osd)\s*=\s*"([^"]+)"')
+_KEYRING_ALL_CAPS_RE = re.compile(r'caps\s+(\S+)\s*=\s*"([^"]*)"')
+_ALLOW_RE = re.compile(r'allow\s+([a-z*]+)')
+_FSNAME_RE = re.compile(r'fsname=([A-Za-z0-9_.:-]+)')
+_PATH_RE = re.compile(r'path=([^,\s]+)')
+_DATA_RE = re.compile(r'data=([A-Za-z0-9_.:-]+)')
+_METADATA_RE = re.compile(r'metadata=([A-Za-z0-9_.:-]+)')
+_FORMATTER = string.Formatter()
+# Subvolume info keys that may hold the path, most preferred first
+_PATH_KEY_RANK = {k: i for i, k in enumerate(("path", "full_path", "mount_path", "mountpoint"))}
+
 def _unescape_keyring_blob(s: str) -> str:
     # export sometimes returns a JSON-escaped string; unescape if needed
     s = str(s)
@@ -37,21 +55,27 @@ def _extract_caps_by_entity_from_keyring(keyring_text: str) -> Dict[str, str]:
             keyring_text = keyring_text.decode("utf-8", "ignore")
         except Exception:
             keyring_text = str(keyring_text)
-    for ent in ("mon", "mds", "osd"):
-        m = re.search(rf'caps\s+{ent}\s*=\s*"([^"]+)"', keyring_text)
-        if m:
-            out[ent] = m.group(1)
+    # single scan; the first occurrence of each entity wins
+    for m in _KEYRING_CAPS_RE.finditer(keyring_text):
+        out.setdefault(m.group(1), m.group(2))
     return out
 
+def _caps_signature(caps: Dict[str, str]) -> Dict[str, FrozenSet[str]]:
+    """Per-entity set of whitespace-normalized clauses, so clause order and spacing do not matter."""
+    return {
+        ent: frozenset(" ".join(c.split()) for c in cap.split(",") if c.strip())
+        for ent, cap in caps.items()
+    }
+
 def _parse_mds_caps(mds: str) -> List[Tuple[str, str, str]]:
     """Return list of (fsname, path, perm)."""
     res: List[Tuple[str, str, str]] = []
     if not mds:
         return res
     for clause in (c.strip() for c in mds.split(",") if c.strip()):
-        pm = re.search(r'allow\s+([a-z*]+)', clause)
-        fm = re.search(r'fsname=([A-Za-z0-9_.:-]+)', clause)
-        pa = re.search(r'path=([^,\s]+)', clause)
+        pm = _ALLOW_RE.search(clause)
+        fm = _FSNAME_RE.search(clause)
+        pa = _PATH_RE.search(clause)
         if pm and fm and pa:
             res.append((fm.group(1), pa.group(1), pm.group(1)))
     return res
@@ -67,19 +91,16 @@ def _format_mds_caps(clauses: List[Tuple[str, str, str]]) -> str:
     return ", ".join(f"allow {perm} fsname={fs} path={path}" for (fs, path), perm in ordered)
 
 def _merge_mon(existing: str, new: str) -> str:
-    fs_re = re.compile(r'fsname=([A-Za-z0-9_.:-]+)')
-    have = set(fs_re.findall(existing or ""))
-    add  = set(fs_re.findall(new or ""))
+    have = set(_FSNAME_RE.findall(existing or ""))
+    add  = set(_FSNAME_RE.findall(new or ""))
     allfs = have | add
     if not allfs:
         return existing or new
     return ", ".join(sorted({f"allow r fsname={fs}" for fs in allfs}))
 
 def _merge_osd(existing: str, new: str) -> str:
-    d_re = re.compile(r'data=([A-Za-z0-9_.:-]+)')
-    m_re = re.compile(r'metadata=([A-Za-z0-9_.:-]+)')
-    have_d, have_m = set(d_re.findall(existing or "")), set(m_re.findall(existing or ""))
-    add_d,  add_m  = set(d_re.findall(new or "")),     set(m_re.findall(new or ""))
+    have_d, have_m = set(_DATA_RE.findall(existing or "")), set(_METADATA_RE.findall(existing or ""))
+    add_d,  add_m  = set(_DATA_RE.findall(new or "")),     set(_METADATA_RE.findall(new or ""))
     all_d,  all_m  = have_d | add_d,                   have_m | add_m
     parts = {f"allow rw tag cephfs data={fs}" for fs in all_d}
     parts |= {f"allow rw tag cephfs metadata={fs}" for fs in all_m}
@@ -87,14 +108,20 @@ def _merge_osd(existing: str, new: str) -> str:
 
 
 def _resolve_subvol_path(dc: DashClient, fs_name: str, subvol_name: str, group_name: Optional[str]) -> str:
-    info = dc.get_subvolume_info(fs_name, subvol_name, group_name)
-    for k in ("path", "full_path", "mount_path", "mountpoint"):
-        p = info.get(k)
-        if isinstance(p, str) and p.startswith("/"):
-            return p
-    for v in info.values():
+    info = dc.get_subvolume_info_cached(fs_name, subvol_name, group_name)
+    # One pass: preferred keys win in _PATH_KEY_RANK order, else the first absolute path seen
+    best, best_rank, fallback = None, len(_PATH_KEY_RANK), None
+    for k, v in info.items():
         if isinstance(v, str) and v.startswith("/"):
-            return v
+            rank = _PATH_KEY_RANK.get(k)
+            if rank == 0:
+                return v
+            if rank is not None and rank < best_rank:
+                best, best_rank = v, rank
+            elif fallback is None:
+                fallback = v
+    if best is not None or fallback is not None:
+        return best if best is not None else fallback
     raise RuntimeError(
         f"Could not resolve subvolume path for {fs_name}:{group_name}:{subvol_name} on {dc.cluster_name}"
     )
@@ -118,6 +145,28 @@ def _merge_rendered_caps_per_entity(rendered_caps: List[Dict[str, str]]) -> List
     return merged
 
 
+@lru_cache(maxsize=256)
+def _tokenize_cap(tpl: str) -> Optional[Tuple[Tuple[str, Optional[str]], ...]]:
+    """
+    Split a cap template into (literal, field) pairs once. Returns None when the
+    template uses anything beyond plain {name} fields (format spec, conversion,
+    attribute/index access) so the caller falls back to str.format.
+    """
+    tokens = []
+    for literal, field, spec, conversion in _FORMATTER.parse(tpl):
+        if field is not None and (spec or conversion or not field.isidentifier()):
+            return None
+        tokens.append((literal, field))
+    return tuple(tokens)
+
+
+def _render_cap(tpl: str, subs: Dict[str, str]) -> str:
+    tokens = _tokenize_cap(tpl)
+    if tokens is None:
+        return tpl.format(**subs)
+    return "".join(literal if field is None else literal + str(subs[field]) for literal, field in tokens)
+
+
 def _render_caps_for_contexts(tmpl_caps: List[Dict[str, str]], contexts: List[Dict[str, str]]) -> List[Dict[str, str]]:
     """
     Render template caps for each context, return the merged list (per-entity).
@@ -132,7 +181,7 @@ def _render_caps_for_contexts(tmpl_caps: List[Dict[str, str]], contexts: List[Di
             "subvol": ctx["subvol"],
         }
         for c in tmpl_caps:
-            rendered_all.append({"entity": c["entity"], "cap": c["cap"].format(**subs)})
+            rendered_all.append({"entity": c["entity"], "cap": _render_cap(c["cap"], subs)})
     return _merge_rendered_caps_per_entity(rendered_all)
 
 
@@ -165,11 +214,17 @@ def ensure_user_on_cluster_with_cluster_paths_multi(
     updated_on_source = False
     caps_applied: Dict[str, List[Dict[str, str]]] = {}
 
-    # Resolve all contexts on this cluster
+    # Resolve all contexts on this cluster (one dashboard GET each, run concurrently;
+    # results are consumed in request order and stop at the first failure as before)
     contexts: List[Dict[str, str]] = []
     try:
-        for r in renders:
-            p = _resolve_subvol_path(dc, r["fs_name"], r["subvol_name"], r.get("group_name"))
+        with ThreadPoolExecutor(max_workers=min(_MAX_WORKERS, max(1, len(renders)))) as ex:
+            futures = [
+                ex.submit(_resolve_subvol_path, dc, r["fs_name"], r["subvol_name"], r.get("group_name"))
+                for r in renders
+            ]
+        for r, future in zip(renders, futures):
+            p = future.result()
             contexts.append(
                 {
                     "fs": r["fs_name"],
@@ -191,10 +246,13 @@ def ensure_user_on_cluster_with_cluster_paths_multi(
         new_map = {c["entity"]: c["cap"] for c in caps_here}
 
         # Read existing caps from keyring (if user exists)
+        current_caps: Dict[str, str] = {}
         try:
             existing_keyring = dc.export_keyring(user_entity)
             existing_keyring = _unescape_keyring_blob(existing_keyring)
             existing_map = _extract_caps_by_entity_from_keyring(existing_keyring) if existing_keyring else {}
+            if existing_keyring:
+                current_caps = dict(_KEYRING_ALL_CAPS_RE.findall(existing_keyring))
             log.debug(f"existing keyring: {existing_keyring}")
         except Exception:
             existing_map = {}
@@ -239,15 +297,20 @@ def ensure_user_on_cluster_with_cluster_paths_multi(
                 final_caps.append({"entity": ent, "cap": cap})
 
         log.debug(f"final caps: {final_caps}")
-        # Apply (update → create fallback)
-        status, detail = dc.update_user_caps(user_entity, final_caps)
-        if status in (200, 201, 202):
-            updated_on_source = True
+        if current_caps and _caps_signature(current_caps) == _caps_signature(
+                {c["entity"]: c["cap"] for c in final_caps}):
+            # Steady state: the user already has exactly these caps, skip the write
+            log.debug(f"caps for {user_entity} already up to date; skipping update")
         else:
-            log.error(f"failed to update user caps for {user_entity} details: {detail}")
-            dc.create_user(user_entity, final_caps)
-            created_on_source = True
-            updated_on_source = True
+            # Apply (update → create fallback)
+            status, detail = dc.update_user_caps(user_entity, final_caps)
+            if status in (200, 201, 202):
+                updated_on_source = True
+            else:
+                log.error(f"failed to update user caps for {user_entity} details: {detail}")
+                dc.create_user(user_entity, final_caps)
+                created_on_source = True
+                updated_on_source = True
 
         caps_applied[cluster] = final_caps
     except Exception as e:
@@ -269,7 +332,7 @@ def ensure_user_on_cluster_with_cluster_paths_multi(
 
 # ---------- per-cluster delete ----------
 
-@dataclass
+@dataclass(slots=True)
 class DeleteResult:
     entity: str
     deleted_from: List[str]
@@ -373,9 +436,13 @@ def export_users_on_cluster(
     dc = DashClient.for_cluster(cluster, cfg.cluster[cluster])
     exported: Dict[str, str] = {}
 
-    for ent in entities:
+    # Export calls are independent; issue them concurrently and collect in request order
+    with ThreadPoolExecutor(max_workers=min(_MAX_WORKERS, len(entities))) as ex:
+        futures = [(ent, ex.submit(dc.export_keyring, ent)) for ent in entities]
+
+    for ent, future in futures:
         try:
-            keyring = dc.export_keyring(ent)
+            keyring = future.result()
             exported[ent] = _unescape_keyring_blob(keyring)
             #exported[ent] = keyring if not keyring_only else (keyring_minimal(keyring) or "")
             if keyring_only and not exported[ent]:
@@ -23,86 +23,244 @@
 #
 #
 # Author: Komal Thareja (kthare10@renci.org)
-from dataclasses import dataclass
+import json
+import os
+import ssl
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from typing import Dict, List, Tuple, Optional, Any, Union
-from urllib.parse import urlparse
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib3.util.ssl_ import create_urllib3_context
 
 from fabric_ceph.common.config import ClusterEntry
 
-ACCEPT = "application/vnd.ceph.api.v1.0+json"
+try:
+    import orjson  # optional: faster JSON encode/decode
+except ImportError:
+    orjson = None
 
+ACCEPT = "application/vnd.ceph.api.v1.0+json"
 
-@dataclass
+# One keep-alive session per (cluster, dashboard API, CA bundle) shared by every
+# DashClient; /auth goes through it too, so login uses the same pinned SSLContext.
+_SESSIONS: Dict[Tuple[str, str, Optional[str]], requests.Session] = {}
+_SESSIONS_LOCK = threading.Lock()
+# DashClients by cluster name; the ClusterEntry is kept so a config reload
+# (new entry objects) rebuilds the client instead of reusing a stale one.
+_CLIENTS: Dict[str, Tuple[ClusterEntry, float, "DashClient"]] = {}
+_CLIENTS_TTL = 600.0
+# Subvolume info by (cluster, fs, group, subvol) -> (monotonic expiry, info); only
+# used to resolve paths, which do not change for the life of a subvolume. Every entry
+# has the same TTL, so insertion order is expiry order and the oldest entry goes first.
+_SUBVOL_INFO: "OrderedDict[Tuple[str, str, str, str], Tuple[float, dict]]" = OrderedDict()
+_SUBVOL_INFO_LOCK = threading.Lock()
+_SUBVOL_INFO_TTL = 60.0
+_SUBVOL_INFO_MAX = 1024
+# Last user list per (cluster, dashboard API) with its ETag, for If-None-Match
+_USERS_BY_ETAG: Dict[Tuple[str, str], Tuple[str, List[Dict]]] = {}
+# One SSLContext per CA bundle, loaded once and shared by every pool that uses it
+_SSL_CONTEXTS: Dict[str, ssl.SSLContext] = {}
+
+
+class _PinnedSSLAdapter(HTTPAdapter):
+    """
+    HTTPAdapter whose pools all reuse a pre-built SSLContext. The context is the only
+    trust store: requests would otherwise point urllib3 at certifi (or a verify path),
+    which gets loaded into the shared context on every new connection.
+    """
+
+    def __init__(self, ssl_context: ssl.SSLContext, **kwargs):
+        self._ssl_context = ssl_context
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs["ssl_context"] = self._ssl_context
+        return super().init_poolmanager(*args, **kwargs)
+
+    def build_connection_pool_key_attributes(self, request, verify, cert=None):
+        host_params, pool_kwargs = super().build_connection_pool_key_attributes(request, verify, cert)
+        pool_kwargs.pop("ca_certs", None)
+        pool_kwargs.pop("ca_cert_dir", None)
+        return host_params, pool_kwargs
+
+    def cert_verify(self, conn, url, verify, cert):
+        super().cert_verify(conn, url, False, cert)
+        if url.lower().startswith("https") and verify:
+            conn.cert_reqs = "CERT_REQUIRED"
+
+
+def _ssl_context_for(ca_bundle: str) -> ssl.SSLContext:
+    ctx = _SSL_CONTEXTS.get(ca_bundle)
+    if ctx is None:
+        ctx = create_urllib3_context()
+        if os.path.isdir(ca_bundle):
+            ctx.load_verify_locations(capath=ca_bundle)
+        else:
+            ctx.load_verify_locations(cafile=ca_bundle)
+        _SSL_CONTEXTS[ca_bundle] = ctx
+    return ctx
+
+
+def _get_session(cluster_name: str, base_api: str, ca_bundle: Optional[str] = None) -> requests.Session:
+    key = (cluster_name, base_api, ca_bundle)
+    session = _SESSIONS.get(key)
+    if session is not None:
+        return session
+    with _SESSIONS_LOCK:
+        session = _SESSIONS.get(key)
+        if session is None:
+            # Retry connection failures (nothing reached the server) for any method, but
+            # never read timeouts, and gateway errors only on GET: a PUT/POST/DELETE may
+            # already have been applied. Keep the final response (rather than raising)
+            # so callers can inspect status codes.
+            retry = Retry(total=2, connect=2, read=0, status=2, backoff_factor=0.2,
+                          status_forcelist=[502, 503, 504], allowed_methods=frozenset({"GET"}),
+                          raise_on_status=False)
+            session = requests.Session()
+            session.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retry))
+            if ca_bundle:
+                # The CA bundle is already loaded into the pinned context; verify=True
+                # only turns on certificate checks (see _PinnedSSLAdapter.cert_verify).
+                session.mount("https://", _PinnedSSLAdapter(_ssl_context_for(ca_bundle), pool_connections=4,
+                                                            pool_maxsize=16, max_retries=retry))
+                session.verify = True
+            else:
+                session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retry))
+                session.verify = False
+            session.headers.update({"Accept": ACCEPT, "Content-Type": "application/json"})
+            _SESSIONS[key] = session
+    return session
+
+
+def _json_body(payload: Any) -> bytes:
+    """Encode a JSON request body; the Content-Type header is a session default."""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, allow_nan=False).encode("utf-8")
+
+
+def _json(r: requests.Response) -> Any:
+    """Decode a JSON response body, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(r.content)
+    return r.json()
+
+
+@dataclass(slots=True)
 class DashClient:
     cluster_name: str
     cluster: ClusterEntry
-    token: str
-    verify_tls: bool
+    token: Optional[str]  # None until the first request logs in
+    _login_lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False, compare=False)
 
     @classmethod
     def for_cluster(cls, name: str, cluster: ClusterEntry) -> "DashClient":
-        # Default verify: True for HTTPS endpoints, False for HTTP endpoints
-        parsed = urlparse(cluster.dashboard.primary_endpoint)
-        '''
-        verify_tls_env = os.getenv(f"{name.upper().replace('-', '_')}_VERIFY_TLS")
-        verify_tls_default = (parsed.scheme == "https")
-        verify_tls = (
-            verify_tls_default
-            if verify_tls_env is None
-            else verify_tls_env.strip().lower() in {"1", "true", "yes", "on"}
-        )
-        '''
-        verify_tls = False
-        token = cluster.dashboard.login_get_jwt(verify_tls=verify_tls)
-        return cls(name, cluster, token, verify_tls)
+        """Return the cached client for this cluster, rebuilt at most every _CLIENTS_TTL seconds."""
+        now = time.monotonic()
+        cached = _CLIENTS.get(name)
+        if cached is not None and cached[0] is cluster and now - cached[1] < _CLIENTS_TTL:
+            return cached[2]
+        client = cls._build(name, cluster)
+        _CLIENTS[name] = (cluster, now, client)
+        return client
+
+    @classmethod
+    def _build(cls, name: str, cluster: ClusterEntry) -> "DashClient":
+        # TLS verification is a property of the cluster's session (see _get_session):
+        # pinned to the configured CA bundle when one is set, otherwise the dashboard's
+        # self-signed certificate is accepted. Login is deferred to the first request,
+        # so building clients for clusters a request never touches costs nothing.
+        return cls(name, cluster, None)
 
     @property
     def base_api(self) -> str:
         return self.cluster.dashboard.base_api_url
 
-    def _hdrs(self) -> Dict[str, str]:
-        return {
-            "Accept": ACCEPT,
-            "Authorization": f"Bearer {self.token}",
-            "Content-Type": "application/json",
-        }
+    @property
+    def session(self) -> requests.Session:
+        return _get_session(self.cluster_name, self.base_api, self.cluster.dashboard.ca_bundle)
+
+    def __post_init__(self):
+        if self.token is not None:
+            self._set_token(self.token)
+
+    def _ensure_token(self) -> None:
+        with self._login_lock:
+            if self.token is None:
+                self._set_token(self.cluster.dashboard.login_get_jwt(session=self.session))
+
+    def _set_token(self, token: str) -> None:
+        # Accept/Content-Type are session defaults; the bearer token is shared by
+        # every client of this cluster, so it lives on the session too.
+        self.token = token
+        self.session.headers["Authorization"] = f"Bearer {token}"
+
+    def _request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        Send an authenticated request. On 401 the cached JWT is evicted, a fresh
+        one is obtained and the request is retried once.
+        """
+        if self.token is None:
+            self._ensure_token()
+        session = self.session
+        r = session.request(method, url, **kwargs)
+        if r.status_code == 401:
+            self.cluster.dashboard.invalidate_jwt()
+            self._set_token(self.cluster.dashboard.login_get_jwt(session=session))
+            r = session.request(method, url, **kwargs)
+        return r
 
     def list_users(self) -> List[Dict]:
-        r = requests.get(f"{self.base_api}/cluster/user", headers=self._hdrs(), timeout=60, verify=self.verify_tls)
+        # Revalidate the previous list with its ETag; a 304 skips the transfer and parse.
+        # Dashboards that send no ETag simply get the unconditional GET.
+        key = (self.cluster_name, self.base_api)
+        cached = _USERS_BY_ETAG.get(key)
+        headers = {"If-None-Match": cached[0]} if cached else None
+        r = self._request("GET", f"{self.base_api}/cluster/user", headers=headers, timeout=60)
+        if r.status_code == 304 and cached:
+            return cached[1]
         r.raise_for_status()
-        js = r.json()
-        if isinstance(js, list):
-            return js
-        if isinstance(js, dict) and "data" in js and isinstance(js["data"], list):
-            return js["data"]
-        return []
+        js = _json(r)
+        if isinstance(js, dict):
+            data = js.get("data")
+            users = data if isinstance(data, list) else []
+        else:
+            users = js if isinstance(js, list) else []
+        etag = r.headers.get("ETag")
+        if etag:
+            _USERS_BY_ETAG[key] = (etag, users)
+        else:
+            _USERS_BY_ETAG.pop(key, None)
+        return users
 
     def delete_user(self, entity: str) -> Tuple[bool, Optional[str]]:
-        r = requests.delete(f"{self.base_api}/cluster/user/{entity}", headers=self._hdrs(), timeout=60,
-                            verify=self.verify_tls)
+        r = self._request("DELETE", f"{self.base_api}/cluster/user/{entity}", timeout=60)
         if r.status_code in (200, 202, 204):
             return True, None
         # common not-found codes
         if r.status_code in (400, 404):
             try:
-                return False, r.json().get("detail") or r.text
+                return False, _json(r).get("detail") or r.text
             except Exception:
                 return False, r.text
         # treat others as errors
         try:
-            detail = r.json()
+            detail = _json(r)
         except Exception:
             detail = r.text
         raise RuntimeError(f"delete_user failed {r.status_code}: {detail}")
 
     def create_user(self, user_entity: str, capabilities: List[Dict[str, str]]) -> int:
         payload = {"user_entity": user_entity, "capabilities": capabilities}
-        r = requests.post(f"{self.base_api}/cluster/user", headers=self._hdrs(), json=payload, timeout=60, verify=self.verify_tls)
+        r = self._request("POST", f"{self.base_api}/cluster/user", data=_json_body(payload), timeout=60)
         if r.status_code not in (200, 201, 202):
             try:
-                detail = r.json()
+                detail = _json(r)
             except Exception:
                 detail = r.text
             raise RuntimeError(f"[{self.cluster_name}] create_user failed: {r.status_code} {detail}")
@@ -110,10 +268,10 @@ class DashClient:
 
     def export_keyring(self, user_entity: str) -> str:
         payload = {"entities": [user_entity]}
-        r = requests.post(f"{self.base_api}/cluster/user/export", headers=self._hdrs(), json=payload, timeout=60, verify=self.verify_tls)
+        r = self._request("POST", f"{self.base_api}/cluster/user/export", data=_json_body(payload), timeout=60)
         r.raise_for_status()
         try:
-            js = r.json()
+            js = _json(r)
             if isinstance(js, dict):
                 # common shapes: {"keyring": "..."} or raw string
                 return js.get("keyring") or js.get("result") or js.get("output") or r.text
@@ -128,10 +286,9 @@ class DashClient:
         """
         payload = {"user_entity": user_entity, "capabilities": capabilities}
         print(payload)
-        r = requests.put(f"{self.base_api}/cluster/user", headers=self._hdrs(),
-                         json=payload, timeout=60, verify=self.verify_tls)
+        r = self._request("PUT", f"{self.base_api}/cluster/user", data=_json_body(payload), timeout=60)
         try:
-            detail = r.json()
+            detail = _json(r)
         except Exception:
             detail = r.text
         return r.status_code, detail
@@ -145,7 +302,7 @@ class DashClient:
         """
         url = f"{self.base_api}/cephfs/subvolume/group"
         payload = {"vol_name": fs_name, "group_name": group_name}
-        r = requests.post(url, headers=self._hdrs(), json=payload, timeout=60, verify=self.verify_tls)
+        r = self._request("POST", url, data=_json_body(payload), timeout=60)
         # many dashboards return 200/201/202; treat 400 with existing group as OK
         if r.status_code in (200, 201, 202, 204):
             return
@@ -180,10 +337,10 @@ class DashClient:
             payload["size"] = int(size_bytes)
         if mode:
             payload["mode"] = str(mode)
-        r = requests.post(url, headers=self._hdrs(), json=payload, timeout=60, verify=self.verify_tls)
+        r = self._request("POST", url, data=_json_body(payload), timeout=60)
         if r.status_code not in (200, 201, 202):
             try:
-                detail = r.json()
+                detail = _json(r)
             except Exception:
                 detail = r.text
             raise RuntimeError(f"[{self.cluster_name}] subvolume create/resize failed: {r.status_code} {detail}")
@@ -209,10 +366,10 @@ class DashClient:
             payload["size"] = int(size_bytes)
         if mode:
             payload["mode"] = str(mode)
-        r = requests.put(url, headers=self._hdrs(), json=payload, timeout=60, verify=self.verify_tls)
+        r = self._request("PUT", url, data=_json_body(payload), timeout=60)
         if r.status_code not in (200, 201, 202):
             try:
-                detail = r.json()
+                detail = _json(r)
             except Exception:
                 detail = r.text
             raise RuntimeError(f"[{self.cluster_name}] subvolume create/resize failed: {r.status_code} {detail}")
@@ -226,9 +383,37 @@ class DashClient:
         params = {"subvol_name": subvol_name}
         if group_name:
             params["group_name"] = group_name
-        r = requests.get(url, headers=self._hdrs(), params=params, timeout=60, verify=self.verify_tls)
+        r = self._request("GET", url, params=params, timeout=60)
         r.raise_for_status()
-        return r.json()
+        return _json(r)
+
+    def get_subvolume_info_cached(self, fs_name: str, subvol_name: str, group_name: str | None = None) -> dict:
+        """
+        get_subvolume_info() with a short TTL cache; failures are not cached and
+        delete_subvolume()/delete_subvolume_group() evict affected entries.
+        """
+        key = (self.cluster_name, fs_name, group_name or "", subvol_name)
+        cached = _SUBVOL_INFO.get(key)
+        if cached is not None and time.monotonic() < cached[0]:
+            return cached[1]
+        info = self.get_subvolume_info(fs_name, subvol_name, group_name)
+        with _SUBVOL_INFO_LOCK:
+            now = time.monotonic()
+            _SUBVOL_INFO[key] = (now + _SUBVOL_INFO_TTL, info)
+            _SUBVOL_INFO.move_to_end(key)
+            while _SUBVOL_INFO:
+                oldest = next(iter(_SUBVOL_INFO.values()))
+                if oldest[0] > now and len(_SUBVOL_INFO) <= _SUBVOL_INFO_MAX:
+                    break
+                _SUBVOL_INFO.popitem(last=False)
+        return info
+
+    def _evict_subvolume_info(self, fs_name: str, group_name: str | None, subvol_name: str | None = None) -> None:
+        group = group_name or ""
+        with _SUBVOL_INFO_LOCK:
+            for key in [k for k in _SUBVOL_INFO
+                        if k[:3] == (self.cluster_name, fs_name, group) and subvol_name in (None, k[3])]:
+                del _SUBVOL_INFO[key]
 
     def subvolume_exists(self, fs_name: str, subvol_name: str, group_name: str | None = None) -> bool:
         """
@@ -238,10 +423,10 @@ class DashClient:
         params = {"subvol_name": subvol_name}
         if group_name:
             params["group_name"] = group_name
-        r = requests.get(url, headers=self._hdrs(), params=params, timeout=30, verify=self.verify_tls)
+        r = self._request("GET", url, params=params, timeout=30)
         if r.status_code == 200:
             try:
-                js = r.json()
+                js = _json(r)
                 if isinstance(js, dict) and "exists" in js:
                     return bool(js["exists"])
             except Exception:
@@ -261,10 +446,11 @@ class DashClient:
         params = {"subvol_name": subvol_name}
         if group_name:
             params["group_name"] = group_name
-        r = requests.delete(url, headers=self._hdrs(), params=params, timeout=60, verify=self.verify_tls)
+        self._evict_subvolume_info(fs_name, group_name, subvol_name)
+        r = self._request("DELETE", url, params=params, timeout=60)
         if r.status_code not in (200, 202, 204):
             try:
-                detail = r.json()
+                detail = _json(r)
             except Exception:
                 detail = r.text
             raise RuntimeError(f"[{self.cluster_name}] subvolume delete failed: {r.status_code} {detail}")
@@ -275,25 +461,25 @@ class DashClient:
         """
         url = f"{self.base_api}/cephfs/subvolume/group/{fs_name}"
         params = {"group_name": group_name}
-        r = requests.delete(url, headers=self._hdrs(), params=params, timeout=60, verify=self.verify_tls)
+        self._evict_subvolume_info(fs_name, group_name)
+        r = self._request("DELETE", url, params=params, timeout=60)
         if r.status_code not in (200, 202, 204):
             try:
-                detail = r.json()
+                detail = _json(r)
             except Exception:
                 detail = r.text
             raise RuntimeError(f"[{self.cluster_name}] subvolume group delete failed: {r.status_code} {detail}")
 
     def get_cluster_fsid(self) -> str:
-        r = requests.get(f"{self.base_api}/health/get_cluster_fsid",
-                         headers=self._hdrs(), timeout=60, verify=self.verify_tls)
+        r = self._request("GET", f"{self.base_api}/health/get_cluster_fsid", timeout=60)
         r.raise_for_status()
-        return r.json() if isinstance(r.json(), str) else str(r.json())
+        js = _json(r)
+        return js if isinstance(js, str) else str(js)
 
     def get_monitor_map(self) -> dict:
-        r = requests.get(f"{self.base_api}/monitor",
-                         headers=self._hdrs(), timeout=60, verify=self.verify_tls)
+        r = self._request("GET", f"{self.base_api}/monitor", timeout=60)
         r.raise_for_status()
-        return r.json()
+        return _json(r)
 
     # ---------- CephX auth helpers ----------
 
@@ -433,10 +619,9 @@ class DashClient:
         if info:
             params["info"] = "true"
 
-        r = requests.get(url, headers=self._hdrs(), params=params,
-                         timeout=timeout, verify=self.verify_tls)
+        r = self._request("GET", url, params=params, timeout=timeout)
         r.raise_for_status()
-        js = r.json()
+        js = _json(r)
 
         # Common shapes:
         # - list[str] or list[dict]
@@ -476,10 +661,9 @@ class DashClient:
         if info:
             params["info"] = "true"
 
-        r = requests.get(url, headers=self._hdrs(), params=params,
-                         timeout=timeout, verify=self.verify_tls)
+        r = self._request("GET", url, params=params, timeout=timeout)
         r.raise_for_status()
-        js = r.json()
+        js = _json(r)
 
         if isinstance(js, list):
             return js
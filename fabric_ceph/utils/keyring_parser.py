@@ -12,6 +12,12 @@ def keyring_minimal(s: str) -> str:
             s = json.loads(s)
         except Exception:
             pass
-    # Now s should be real multiline text
-    lines = s.splitlines()
-    return "\n".join(lines[:2]) + "\n"
\ No newline at end of file
+    # Now s should be real multiline text; cut after the second line without
+    # splitting the whole blob
+    first = s.find("\n")
+    second = s.find("\n", first + 1) if first != -1 else -1
+    if second != -1:
+        head = s[:second]
+    else:
+        head = s[:-1] if s.endswith("\n") else s
+    return head.replace("\r\n", "\n").rstrip("\r") + "\n"
\ No newline at end of file
@@ -29,6 +29,13 @@ import threading
 from logging.handlers import RotatingFileHandler
 from pathlib import Path
 
+_DEFAULT_LOG_FORMAT = \
+    '%(asctime)s - %(name)s - {%(filename)s:%(lineno)d} - [%(threadName)s-%(thread_id)s]- %(levelname)s - %(message)s'
+_DEFAULT_FMT = logging.Formatter(_DEFAULT_LOG_FORMAT)
+
+# Log directories already created by this process
+_PREPARED_DIRS: set[str] = set()
+
 
 class LogHelper:
     @staticmethod
@@ -38,7 +45,8 @@ class LogHelper:
         Detects the path and level for the log file from the actor config and sets
         up a logger. Instead of detecting the path and/or level from the
         config, a custom path and/or level for the log file can be passed as
-        optional arguments.
+        optional arguments. Calling it again for the same logger/file does not
+        attach duplicate handlers.
 
        :param log_dir: Log directory
        :param log_file
@@ -61,31 +69,29 @@ class LogHelper:
         # Set up the root logger
         log = logging.getLogger(logger)
         log.setLevel(log_level)
-        default_log_format = \
-            '%(asctime)s - %(name)s - {%(filename)s:%(lineno)d} - [%(threadName)s-%(thread_id)s]- %(levelname)s - %(message)s'
-        if log_format is not None:
-            default_log_format = log_format
+        formatter = _DEFAULT_FMT if log_format is None else logging.Formatter(log_format)
 
-        os.makedirs(os.path.dirname(log_path), exist_ok=True)
+        log_dir_name = os.path.dirname(log_path)
+        if log_dir_name not in _PREPARED_DIRS:
+            os.makedirs(log_dir_name, exist_ok=True)
+            _PREPARED_DIRS.add(log_dir_name)
 
-        file_handler = RotatingFileHandler(log_path, backupCount=int(log_retain), maxBytes=int(log_size))
-        file_handler.addFilter(LogHelper.thread_id_filter)
-        file_handler.setFormatter(logging.Formatter(default_log_format))
-        log.addHandler(file_handler)
-
-        console_log = logging.getLogger()
-        console_handler = logging.StreamHandler()
-        console_handler.setLevel(logging.CRITICAL)
-        console_log.addHandler(console_handler)
+        base_filename = os.path.abspath(log_path)
+        if not any(isinstance(h, RotatingFileHandler) and h.baseFilename == base_filename for h in log.handlers):
+            file_handler = RotatingFileHandler(log_path, backupCount=int(log_retain), maxBytes=int(log_size))
+            file_handler.addFilter(LogHelper.thread_id_filter)
+            file_handler.setFormatter(formatter)
+            log.addHandler(file_handler)
 
         #logging.basicConfig(handlers=[file_handler], format=log_format, force=True)
         #file_handler.addFilter(LogHelper.thread_id_filter)
 
         # Disable console logging to prevent /var partition from filling up with container logs
         console_log = logging.getLogger()
-        console_handler = logging.StreamHandler()
-        console_handler.setLevel(logging.CRITICAL)
-        console_log.addHandler(console_handler)
+        if not any(type(h) is logging.StreamHandler and h.level == logging.CRITICAL for h in console_log.handlers):
+            console_handler = logging.StreamHandler()
+            console_handler.setLevel(logging.CRITICAL)
+            console_log.addHandler(console_handler)
         return log
 
     @staticmethod
@@ -27,7 +27,7 @@ from http.client import BAD_REQUEST, UNAUTHORIZED, FORBIDDEN, NOT_FOUND
 from typing import Union, List, Tuple, Dict
 
 import connexion
-from flask import Response, request
+from flask import Response, request, g
 
 from fabric_ceph.common.config import Config
 from fabric_ceph.common.globals import get_globals
@@ -55,12 +55,18 @@ def authorize() -> Tuple[FabricToken, bool, Optional[str]]:
     Validate the caller's bearer token, determine whether they are an owner of the
     configured service project, and return the user's bastion login (if present).
 
+    The result is memoized on flask.g, so repeat calls within one request are free.
+
     Returns:
         (fabric_token, is_owner, bastion_login)
     Raises:
         TokenException: if the token is invalid or missing required claims.
         CoreApiError: for Core API communication or response errors (unless caught below).
     """
+    cached = getattr(g, "_auth", None)
+    if cached is not None:
+        return cached
+
     token = get_token()
     globals_ = get_globals()
 
@@ -98,24 +104,22 @@ def authorize() -> Tuple[FabricToken, bool, Optional[str]]:
     except CoreApiError as e:
         raise CephException(str(e), http_error_code=UNAUTHORIZED)
 
-    return fabric_token, is_owner, bastion_login
+    g._auth = (fabric_token, is_owner, bastion_login)
+    return g._auth
+
 
+_ERROR_RESPONSES = {
+    BAD_REQUEST: cors_400,
+    UNAUTHORIZED: cors_401,
+    FORBIDDEN: cors_403,
+    NOT_FOUND: cors_404,
+}
 
 
 def cors_error_response(error: Union[CephException, Exception]) -> Response:
-    if isinstance(error, CephException):
-        if error.get_http_error_code() == BAD_REQUEST:
-            return cors_400(details=str(error))
-        elif error.get_http_error_code() == UNAUTHORIZED:
-            return cors_401(details=str(error))
-        elif error.get_http_error_code() == FORBIDDEN:
-            return cors_403(details=str(error))
-        elif error.get_http_error_code() == NOT_FOUND:
-            return cors_404(details=str(error))
-        else:
-            return cors_500(details=str(error))
-    else:
-        return cors_500(details=str(error))
+    handler = _ERROR_RESPONSES.get(error.get_http_error_code(), cors_500) \
+        if isinstance(error, CephException) else cors_500
+    return handler(details=str(error))
 
 
 def cors_success_response(response_body) -> Response:
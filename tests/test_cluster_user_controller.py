@@ -0,0 +1,16 @@
+from fabric_ceph.response.cluster_user_controller import _raw_user_to_ceph_user
+
+
+def test_capability_list_is_normalized():
+    user = _raw_user_to_ceph_user({
+        "entity": "client.alice",
+        "capabilities": [{"entity": "mon", "cap": "allow r", "extra": 1}, "junk", {"entity": "osd"}],
+    })
+    assert user.capabilities == [
+        {"entity": "mon", "cap": "allow r"}]
+
+
+def test_capability_map_is_converted():
+    user = _raw_user_to_ceph_user({"entity": "client.bob", "caps": {"mds": "allow rw"}})
+    assert user.capabilities == [
+        {"entity": "mds", "cap": "allow rw"}]
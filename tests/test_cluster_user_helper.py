@@ -0,0 +1,139 @@
+from types import SimpleNamespace
+
+import pytest
+
+from fabric_ceph.utils import cluster_user_helper
+
+_TEMPLATE = [
+    {"entity": "mon", "cap": "allow r fsname={fs}"},
+    {"entity": "mds", "cap": "allow rw fsname={fs} path={path}"},
+    {"entity": "osd", "cap": "allow rw tag cephfs data={fs}"},
+]
+_RENDERS = [{"fs_name": "CEPH-FS-01", "subvol_name": "sv", "group_name": "g"}]
+
+
+class FakeDash:
+    cluster_name = "c1"
+
+    def __init__(self, keyring="", update_status=200):
+        self.keyring = keyring
+        self.update_status = update_status
+        self.updates = []
+
+    def get_subvolume_info_cached(self, fs_name, subvol_name, group_name=None):
+        return {"path": f"/volumes/{group_name}/{subvol_name}"}
+
+    def export_keyring(self, entity):
+        return self.keyring
+
+    def update_user_caps(self, entity, caps):
+        self.updates.append(caps)
+        return self.update_status, None
+
+    def create_user(self, entity, caps):
+        raise AssertionError("create_user not expected")
+
+
+@pytest.fixture
+def run(monkeypatch):
+    def _run(dc):
+        monkeypatch.setattr(cluster_user_helper.DashClient, "for_cluster", classmethod(lambda cls, n, c: dc))
+        cfg = SimpleNamespace(logging=SimpleNamespace(logger="test"), cluster={"c1": object()})
+        return cluster_user_helper.ensure_user_on_cluster_with_cluster_paths_multi(
+            cfg, "c1", "client.alice", _TEMPLATE, renders=_RENDERS)
+    return _run
+
+
+def _keyring(mon, mds, osd):
+    return ("[client.alice]\n\tkey = AQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA==\n"
+            f'\tcaps mds = "{mds}"\n\tcaps mon = "{mon}"\n\tcaps osd = "{osd}"\n')
+
+
+def test_identical_caps_skip_update(run):
+    dc = FakeDash(_keyring("allow r fsname=CEPH-FS-01",
+                           "allow rw fsname=CEPH-FS-01 path=/volumes/g/sv",
+                           "allow rw tag cephfs data=CEPH-FS-01"))
+    result = run(dc)
+    assert dc.updates == []
+    assert result["updated_on_source"] is False
+    assert result["errors"] == {}
+
+
+def test_changed_caps_are_written(run):
+    dc = FakeDash(_keyring("allow r fsname=CEPH-FS-01",
+                           "allow r fsname=CEPH-FS-01 path=/volumes/g/sv",
+                           "allow rw tag cephfs data=CEPH-FS-01"))
+    result = run(dc)
+    assert len(dc.updates) == 1
+    assert {"entity": "mds", "cap": "allow rw fsname=CEPH-FS-01 path=/volumes/g/sv"} in dc.updates[0]
+    assert result["updated_on_source"] is True
+
+
+def test_new_user_is_written(run):
+    dc = FakeDash("")
+    assert run(dc)["updated_on_source"] is True
+    assert len(dc.updates) == 1
+
+
+def test_clause_order_and_spacing_are_ignored(run):
+    # same grants as the merge produces, but clauses reordered and spaced differently
+    dc = FakeDash(_keyring("allow r fsname=ZZ,allow r  fsname=CEPH-FS-01",
+                           "allow rw fsname=CEPH-FS-01   path=/volumes/g/sv",
+                           "allow rw tag cephfs data=ZZ , allow rw tag cephfs data=CEPH-FS-01"))
+    result = run(dc)
+    assert dc.updates == []
+    assert result["updated_on_source"] is False
+
+
+def _dash_client(monkeypatch, info):
+    from fabric_ceph.utils import dash_client
+    monkeypatch.setattr(dash_client, "_SUBVOL_INFO", dash_client.OrderedDict())
+    calls = []
+    monkeypatch.setattr(dash_client.DashClient, "get_subvolume_info",
+                        lambda self, fs, sv, grp=None: calls.append((fs, sv, grp)) or dict(info))
+    dashboard = SimpleNamespace(base_api_url="http://127.0.0.1:1/api", ca_bundle=None)
+    return dash_client.DashClient("c1", SimpleNamespace(dashboard=dashboard), "tok"), calls
+
+
+def test_resolve_subvol_path_miss_then_hit(monkeypatch):
+    dc, calls = _dash_client(monkeypatch, {"mount_path": "/m", "path": "/volumes/g/sv", "size": 1})
+    assert cluster_user_helper._resolve_subvol_path(dc, "fs", "sv", "g") == "/volumes/g/sv"
+    assert cluster_user_helper._resolve_subvol_path(dc, "fs", "sv", "g") == "/volumes/g/sv"
+    assert calls == [("fs", "sv", "g")]
+
+
+@pytest.mark.parametrize("info, expected", [
+    ({"mountpoint": "/mp", "full_path": "/fp"}, "/fp"),
+    ({"other": "/x", "mountpoint": "/mp"}, "/mp"),
+    ({"name": "sv", "other": "/x", "more": "/y"}, "/x"),
+])
+def test_resolve_subvol_path_key_preference(monkeypatch, info, expected):
+    dc, _ = _dash_client(monkeypatch, info)
+    assert cluster_user_helper._resolve_subvol_path(dc, "fs", "sv", None) == expected
+
+
+def test_resolve_subvol_path_without_path(monkeypatch):
+    dc, _ = _dash_client(monkeypatch, {"name": "sv", "path": "relative"})
+    with pytest.raises(RuntimeError, match="Could not resolve subvolume path"):
+        cluster_user_helper._resolve_subvol_path(dc, "fs", "sv", None)
+
+
+def test_no_renders_resolves_no_paths(monkeypatch):
+    dc = FakeDash("")
+    monkeypatch.setattr(cluster_user_helper.DashClient, "for_cluster", classmethod(lambda cls, n, c: dc))
+    cfg = SimpleNamespace(logging=SimpleNamespace(logger="test"), cluster={"c1": object()})
+    result = cluster_user_helper.ensure_user_on_cluster_with_cluster_paths_multi(
+        cfg, "c1", "client.alice", _TEMPLATE, renders=[])
+    assert result["paths"] == {}
+    assert result["errors"] == {}
+    assert dc.updates == [[]]
+
+
+def test_path_resolution_failure_is_reported(monkeypatch, run):
+    class NoPath(FakeDash):
+        def get_subvolume_info_cached(self, fs_name, subvol_name, group_name=None):
+            return {"name": subvol_name}
+
+    result = run(NoPath(""))
+    assert result["paths"] == {}
+    assert result["errors"]["c1"].startswith("path resolution failed")
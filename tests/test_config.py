@@ -0,0 +1,47 @@
+import pytest
+
+from fabric_ceph.common.config import Config
+
+_YAML = """
+cluster:
+  europe:
+    default_fs: CEPH-FS-01
+    dashboard:
+      endpoints:
+        - https://10.0.0.1:8443/
+      user: admin
+      password: from-file
+    rgw_admin:
+      endpoints:
+        - http://10.0.0.2:8080
+      admin_access_key: ak
+      admin_secret_key: sk
+oauth:
+  jwks-url: https://cm.example.org/credmgr/certs
+"""
+
+
+@pytest.fixture
+def cfg_path(tmp_path):
+    path = tmp_path / "config.yml"
+    path.write_text(_YAML)
+    return path
+
+
+def test_env_overrides_secrets(cfg_path, monkeypatch):
+    assert Config.load_from_file(cfg_path).cluster["europe"].dashboard.password == "from-file"
+    monkeypatch.setenv("EUROPE_DASHBOARD_PASSWORD", "s3cret-from-env")
+    assert Config.load_from_file(cfg_path).cluster["europe"].dashboard.password == "s3cret-from-env"
+
+
+def test_endpoints_are_derived_when_not_given():
+    from collections import OrderedDict
+    from fabric_ceph.common.config import DashboardConfig, RGWAdminConfig
+
+    dash = DashboardConfig(endpoints=["https://10.0.0.1:8443/"], user="admin", password="pw")
+    assert dash.primary_endpoint == "https://10.0.0.1:8443"
+    assert dash.base_api_url == "https://10.0.0.1:8443/api"
+
+    rgw = RGWAdminConfig(endpoints_map=OrderedDict(RENC="http://10.0.0.2:8080/"),
+                         admin_access_key="ak", admin_secret_key="sk")
+    assert rgw.primary_endpoint == "http://10.0.0.2:8080"
@@ -0,0 +1,171 @@
+import pytest
+
+from fabric_ceph.utils import dash_client
+
+
+def test_session_retries_only_safe_failures():
+    session = dash_client._get_session("retry-test", "http://127.0.0.1:1/api")
+    retry = session.get_adapter("http://127.0.0.1:1/").max_retries
+    assert retry.read == 0
+    assert retry.connect == 2
+    assert retry.is_retry("GET", 503)
+    for method in ("PUT", "POST", "DELETE"):
+        assert not retry.is_retry(method, 503)
+
+
+def _client(name, base_api="http://127.0.0.1:1/api"):
+    from types import SimpleNamespace
+    dashboard = SimpleNamespace(base_api_url=base_api, ca_bundle=None)
+    return dash_client.DashClient(name, SimpleNamespace(dashboard=dashboard), "tok")
+
+
+def test_subvolume_info_cache_is_bounded(monkeypatch):
+    monkeypatch.setattr(dash_client, "_SUBVOL_INFO", dash_client.OrderedDict())
+    monkeypatch.setattr(dash_client, "_SUBVOL_INFO_MAX", 3)
+    calls = []
+    monkeypatch.setattr(dash_client.DashClient, "get_subvolume_info",
+                        lambda self, fs, sv, grp=None: calls.append(sv) or {"path": f"/{sv}"})
+    client = _client("subvol-cap")
+    for sv in ("a", "b", "c", "d"):
+        client.get_subvolume_info_cached("fs", sv)
+    assert [k[3] for k in dash_client._SUBVOL_INFO] == ["b", "c", "d"]
+
+    client.get_subvolume_info_cached("fs", "d")
+    assert calls == ["a", "b", "c", "d"]
+
+
+def test_subvolume_info_cache_drops_expired(monkeypatch):
+    monkeypatch.setattr(dash_client, "_SUBVOL_INFO", dash_client.OrderedDict())
+    now = [1000.0]
+    monkeypatch.setattr(dash_client.time, "monotonic", lambda: now[0])
+    monkeypatch.setattr(dash_client.DashClient, "get_subvolume_info",
+                        lambda self, fs, sv, grp=None: {"path": f"/{sv}"})
+    client = _client("subvol-ttl")
+    client.get_subvolume_info_cached("fs", "old")
+    now[0] += dash_client._SUBVOL_INFO_TTL + 1
+    client.get_subvolume_info_cached("fs", "new")
+    assert [k[3] for k in dash_client._SUBVOL_INFO] == ["new"]
+
+
+class _FakeResponse:
+    def __init__(self, status_code, body=None, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+        self._body = body
+        self.content = dash_client.json.dumps(body).encode() if body is not None else b""
+
+    def json(self):
+        return self._body
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise dash_client.requests.HTTPError(str(self.status_code))
+
+
+class _FakeSession:
+    def __init__(self, responses):
+        self.headers = {}
+        self.responses = list(responses)
+        self.sent = []
+
+    def request(self, method, url, **kwargs):
+        self.sent.append((method, url, dict(self.headers), kwargs))
+        return self.responses.pop(0)
+
+
+def _scripted_client(monkeypatch, name, responses, tokens=("jwt-1", "jwt-2", "jwt-3")):
+    from types import SimpleNamespace
+    session = _FakeSession(responses)
+    monkeypatch.setattr(dash_client, "_get_session", lambda *args, **kwargs: session)
+    issued = list(tokens)
+    events = []
+    dashboard = SimpleNamespace(base_api_url="http://127.0.0.1:1/api", ca_bundle=None,
+                                login_get_jwt=lambda **kw: events.append("login") or issued.pop(0),
+                                invalidate_jwt=lambda: events.append("invalidate"))
+    client = dash_client.DashClient(name, SimpleNamespace(dashboard=dashboard), None)
+    return client, session, events
+
+
+def test_401_relogs_in_and_retries_once(monkeypatch):
+    client, session, events = _scripted_client(
+        monkeypatch, "relogin", [_FakeResponse(401), _FakeResponse(200, [])])
+    assert client.list_users() == []
+    assert events == ["login", "invalidate", "login"]
+    assert [s[2]["Authorization"] for s in session.sent] == ["Bearer jwt-1", "Bearer jwt-2"]
+
+    # a second 401 after the re-login is returned to the caller, not retried again
+    monkeypatch.setattr(session, "responses", [_FakeResponse(401), _FakeResponse(401)])
+    with pytest.raises(dash_client.requests.HTTPError):
+        client.list_users()
+    assert len(session.sent) == 4
+
+
+def test_list_users_revalidates_with_etag(monkeypatch):
+    monkeypatch.setattr(dash_client, "_USERS_BY_ETAG", {})
+    users = [{"entity": "client.alice"}]
+    client, session, _ = _scripted_client(monkeypatch, "etag", [
+        _FakeResponse(200, users, {"ETag": '"v1"'}),
+        _FakeResponse(304),
+        _FakeResponse(200, [], None),
+        _FakeResponse(200, []),
+    ])
+    assert client.list_users() == users
+    assert session.sent[0][3]["headers"] is None
+
+    assert client.list_users() == users
+    assert session.sent[1][3]["headers"] == {"If-None-Match": '"v1"'}
+
+    # a response without an ETag drops the cached list
+    assert client.list_users() == []
+    assert client.list_users() == []
+    assert session.sent[3][3]["headers"] is None
+
+
+def test_session_is_keyed_by_ca_bundle(tmp_path):
+    # an (empty) directory is loaded as a capath, so no certificate is needed here
+    plain = dash_client._get_session("ca-key", "https://127.0.0.1:1/api")
+    pinned = dash_client._get_session("ca-key", "https://127.0.0.1:1/api", str(tmp_path))
+    assert plain is not pinned
+    assert plain.verify is False and pinned.verify is True
+    assert isinstance(pinned.get_adapter("https://127.0.0.1:1/"), dash_client._PinnedSSLAdapter)
+
+
+def test_login_uses_the_client_session(monkeypatch):
+    client, session, _ = _scripted_client(monkeypatch, "login-session", [_FakeResponse(200, [])])
+    seen = []
+    client.cluster.dashboard.login_get_jwt = lambda **kw: seen.append(kw) or "jwt"
+    client.list_users()
+    assert seen == [{"session": session}]
+
+
+def test_pinned_context_is_not_extended_by_requests(tmp_path):
+    import socket
+    import threading
+
+    # a listener that drops every connection: the TLS handshake fails, but only after
+    # urllib3 has applied the pool's trust settings to the context
+    srv = socket.socket()
+    srv.bind(("127.0.0.1", 0))
+    srv.listen(8)
+    port = srv.getsockname()[1]
+
+    def serve():
+        while True:
+            try:
+                conn, _ = srv.accept()
+            except OSError:
+                return
+            conn.close()
+
+    threading.Thread(target=serve, daemon=True).start()
+    try:
+        base = f"https://127.0.0.1:{port}/api"
+        session = dash_client._get_session("pinned-ca", base, str(tmp_path))
+        ctx = dash_client._ssl_context_for(str(tmp_path))
+        before = ctx.cert_store_stats()["x509_ca"]
+        with pytest.raises(dash_client.requests.RequestException):
+            session.get(f"{base}/health", timeout=2)
+        assert ctx.cert_store_stats()["x509_ca"] == before
+        assert ctx.verify_mode == dash_client.ssl.CERT_REQUIRED
+    finally:
+        srv.close()
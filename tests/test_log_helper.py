@@ -0,0 +1,25 @@
+import logging
+
+from fabric_ceph.utils import log_helper
+from fabric_ceph.utils.log_helper import LogHelper
+
+
+def test_make_logger_is_idempotent(tmp_path, monkeypatch):
+    made = []
+    real_makedirs = log_helper.os.makedirs
+    monkeypatch.setattr(log_helper.os, "makedirs", lambda p, **kw: made.append(p) or real_makedirs(p, **kw))
+    kwargs = dict(log_dir=tmp_path / "logs", log_file="svc.log", log_level=logging.INFO,
+                  log_retain=1, log_size=1024, logger="test-log-helper")
+    try:
+        first = LogHelper.make_logger(**kwargs)
+        second = LogHelper.make_logger(**kwargs)
+        assert first is second
+        assert len(second.handlers) == 1
+        assert made == [str(tmp_path / "logs")]
+        console = [h for h in logging.getLogger().handlers
+                   if type(h) is logging.StreamHandler and h.level == logging.CRITICAL]
+        assert len(console) == 1
+    finally:
+        for h in list(logging.getLogger("test-log-helper").handlers):
+            h.close()
+            logging.getLogger("test-log-helper").removeHandler(h)
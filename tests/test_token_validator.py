@@ -0,0 +1,68 @@
+import datetime
+import time
+
+import pytest
+from fss_utils.jwt_manager import ValidateCode
+
+from fabric_ceph.security.fabric_token import TokenException
+from fabric_ceph.security.token_validator import TokenValidator
+
+
+class FakeJWTValidator:
+    def __init__(self, exp_in=3600):
+        self.calls = 0
+        self.exp_in = exp_in
+
+    def validate_jwt(self, *, token, verify_exp=False):
+        self.calls += 1
+        return ValidateCode.VALID, {"sub": token, "exp": time.time() + self.exp_in,
+                                    "projects": [{"uuid": "p1", "tags": [], "name": "proj"}]}
+
+
+def _validator(jwt_validator):
+    tv = TokenValidator(credmgr_host="https://cm.example.org", refresh_period=datetime.timedelta(hours=1),
+                        jwt_validator=jwt_validator)
+    # treat the (empty) revoke list as freshly fetched so no request is made
+    tv.trl_fetched = datetime.datetime.now()
+    return tv
+
+
+def test_cache_hit_skips_signature_check():
+    jwt = FakeJWTValidator()
+    tv = _validator(jwt)
+    first = tv.validate_token(token="t1")
+    second = tv.validate_token(token="t1")
+    assert jwt.calls == 1
+    assert first.token_hash == second.token_hash
+
+
+def test_entry_evicted_at_expiry_skew(monkeypatch):
+    jwt = FakeJWTValidator(exp_in=100)
+    tv = _validator(jwt)
+    tv.validate_token(token="t1")
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now + 100 - TokenValidator.VALIDATED_EXPIRY_SKEW)
+    tv.validate_token(token="t1")
+    assert jwt.calls == 2
+
+
+def test_cache_is_lru_bounded(monkeypatch):
+    monkeypatch.setattr(TokenValidator, "VALIDATED_CACHE_SIZE", 2)
+    jwt = FakeJWTValidator()
+    tv = _validator(jwt)
+    for token in ("a", "b", "a", "c"):
+        tv.validate_token(token=token)
+    assert len(tv.validated) == 2
+    assert set(tv.validated) == {tv.generate_sha256(token="a"), tv.generate_sha256(token="c")}
+    tv.validate_token(token="b")
+    assert jwt.calls == 4
+
+
+def test_revoked_token_rejected_on_cache_hit():
+    jwt = FakeJWTValidator()
+    tv = _validator(jwt)
+    tv.validate_token(token="t1")
+    tv.trl = [tv.generate_sha256(token="t1")]
+    with pytest.raises(TokenException, match="revoked"):
+        tv.validate_token(token="t1")
+    assert jwt.calls == 1